@@ -0,0 +1,28 @@
+"""Add beneficiary company name index
+
+Revision ID: 4b7d2e9c1f36
+Revises: a3f58c1d7e42
+Create Date: 2026-10-16 14:05:31.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7d2e9c1f36'
+down_revision: Union[str, None] = 'a3f58c1d7e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_beneficiaries_company_active_name', 'beneficiaries', ['company_id', 'beneficiary_name'], unique=False, postgresql_where=sa.text('is_active'))
+    op.drop_index('idx_beneficiaries_company_active', table_name='beneficiaries', postgresql_where=sa.text('is_active'))
+
+
+def downgrade() -> None:
+    op.create_index('idx_beneficiaries_company_active', 'beneficiaries', ['company_id'], unique=False, postgresql_where=sa.text('is_active'))
+    op.drop_index('idx_beneficiaries_company_active_name', table_name='beneficiaries', postgresql_where=sa.text('is_active'))
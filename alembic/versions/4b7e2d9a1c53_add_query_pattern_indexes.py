@@ -0,0 +1,42 @@
+"""Add query pattern indexes
+
+Revision ID: 4b7e2d9a1c53
+Revises: c0f977e632c2
+Create Date: 2026-10-16 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2d9a1c53'
+down_revision: Union[str, None] = 'c0f977e632c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_fx_quotes_company_open_expiry', 'fx_quotes', ['company_id', 'quote_expires_at'], unique=False, postgresql_where=sa.text('NOT is_expired'))
+    op.create_index('idx_fx_quotes_open_expiry', 'fx_quotes', ['quote_expires_at'], unique=False, postgresql_where=sa.text('NOT is_expired'))
+    op.create_index('idx_payments_company_status_created', 'payments', ['company_id', 'status', 'created_at'], unique=False)
+    op.create_index('idx_payments_created_by', 'payments', ['created_by_user_id'], unique=False)
+    op.create_index('idx_payments_company_awaiting', 'payments', ['company_id', 'created_at'], unique=False, postgresql_where=sa.text("status IN ('pending_approval', 'approved')"))
+    op.create_index('idx_audit_logs_entity', 'audit_logs', ['entity_type', 'entity_id', 'created_at'], unique=False)
+    op.create_index('idx_audit_logs_user_created', 'audit_logs', ['user_id', 'created_at'], unique=False)
+    op.create_index('idx_audit_logs_action_created', 'audit_logs', ['action', 'created_at'], unique=False)
+    op.create_index('idx_audit_logs_created_at', 'audit_logs', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_audit_logs_created_at', table_name='audit_logs')
+    op.drop_index('idx_audit_logs_action_created', table_name='audit_logs')
+    op.drop_index('idx_audit_logs_user_created', table_name='audit_logs')
+    op.drop_index('idx_audit_logs_entity', table_name='audit_logs')
+    op.drop_index('idx_payments_company_awaiting', table_name='payments', postgresql_where=sa.text("status IN ('pending_approval', 'approved')"))
+    op.drop_index('idx_payments_created_by', table_name='payments')
+    op.drop_index('idx_payments_company_status_created', table_name='payments')
+    op.drop_index('idx_fx_quotes_open_expiry', table_name='fx_quotes', postgresql_where=sa.text('NOT is_expired'))
+    op.drop_index('idx_fx_quotes_company_open_expiry', table_name='fx_quotes', postgresql_where=sa.text('NOT is_expired'))
@@ -0,0 +1,29 @@
+"""Add trigram search indexes
+
+Revision ID: 6e0c4a2f9b18
+Revises: 9d31f6a8e2b7
+Create Date: 2026-10-16 11:26:05.871349
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e0c4a2f9b18'
+down_revision: Union[str, None] = '9d31f6a8e2b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('idx_beneficiaries_name_trgm', 'beneficiaries', ['beneficiary_name'], unique=False, postgresql_using='gin', postgresql_ops={'beneficiary_name': 'gin_trgm_ops'})
+    op.create_index('idx_companies_name_trgm', 'companies', ['company_name'], unique=False, postgresql_using='gin', postgresql_ops={'company_name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('idx_companies_name_trgm', table_name='companies', postgresql_using='gin')
+    op.drop_index('idx_beneficiaries_name_trgm', table_name='beneficiaries', postgresql_using='gin')
+    # pg_trgm is left installed; other objects in the database may use it
@@ -0,0 +1,74 @@
+"""Server-side timestamps and bigint keys
+
+Revision ID: 9d31f6a8e2b7
+Revises: 4b7e2d9a1c53
+Create Date: 2026-10-16 10:03:17.552940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d31f6a8e2b7'
+down_revision: Union[str, None] = '4b7e2d9a1c53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CREATED_AT_TABLES = (
+    'users',
+    'companies',
+    'beneficiaries',
+    'beneficiary_bank_accounts',
+    'fx_quotes',
+    'payments',
+    'payment_approvals',
+    'audit_logs',
+)
+UPDATED_AT_TABLES = ('users', 'companies', 'beneficiaries', 'payments')
+
+
+def _timestamp_columns():
+    for table in CREATED_AT_TABLES:
+        yield table, 'created_at'
+    for table in UPDATED_AT_TABLES:
+        yield table, 'updated_at'
+
+
+def upgrade() -> None:
+    # Existing naive values were written with datetime.utcnow(), so read them as UTC
+    for table, column in _timestamp_columns():
+        op.execute(f"UPDATE {table} SET {column} = now() AT TIME ZONE 'UTC' WHERE {column} IS NULL")
+        op.alter_column(table, column,
+                        existing_type=sa.DateTime(),
+                        type_=sa.DateTime(timezone=True),
+                        server_default=sa.func.now(),
+                        nullable=False,
+                        postgresql_using=f"{column} AT TIME ZONE 'UTC'")
+
+    op.alter_column('payment_approvals', 'payment_id', existing_type=sa.Integer(), type_=sa.BigInteger(), existing_nullable=False)
+    op.alter_column('payments', 'id', existing_type=sa.Integer(), type_=sa.BigInteger(), existing_nullable=False)
+    op.alter_column('audit_logs', 'id', existing_type=sa.Integer(), type_=sa.BigInteger(), existing_nullable=False)
+    # Audit rows reference payments by ID too
+    op.alter_column('audit_logs', 'entity_id', existing_type=sa.Integer(), type_=sa.BigInteger(), existing_nullable=False)
+    op.execute('ALTER SEQUENCE payments_id_seq AS bigint')
+    op.execute('ALTER SEQUENCE audit_logs_id_seq AS bigint')
+
+
+def downgrade() -> None:
+    op.execute('ALTER SEQUENCE audit_logs_id_seq AS integer')
+    op.execute('ALTER SEQUENCE payments_id_seq AS integer')
+    op.alter_column('audit_logs', 'entity_id', existing_type=sa.BigInteger(), type_=sa.Integer(), existing_nullable=False)
+    op.alter_column('audit_logs', 'id', existing_type=sa.BigInteger(), type_=sa.Integer(), existing_nullable=False)
+    op.alter_column('payments', 'id', existing_type=sa.BigInteger(), type_=sa.Integer(), existing_nullable=False)
+    op.alter_column('payment_approvals', 'payment_id', existing_type=sa.BigInteger(), type_=sa.Integer(), existing_nullable=False)
+
+    for table, column in _timestamp_columns():
+        op.alter_column(table, column,
+                        existing_type=sa.DateTime(timezone=True),
+                        type_=sa.DateTime(),
+                        server_default=None,
+                        nullable=True,
+                        postgresql_using=f"{column} AT TIME ZONE 'UTC'")
@@ -0,0 +1,30 @@
+"""Add active row partial indexes
+
+Revision ID: a3f58c1d7e42
+Revises: 6e0c4a2f9b18
+Create Date: 2026-10-16 11:48:52.204617
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f58c1d7e42'
+down_revision: Union[str, None] = '6e0c4a2f9b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_users_company_active', 'users', ['company_id'], unique=False, postgresql_where=sa.text('is_active'))
+    op.create_index('idx_beneficiaries_company_active', 'beneficiaries', ['company_id'], unique=False, postgresql_where=sa.text('is_active'))
+    op.create_index('idx_fx_quotes_company_open_created', 'fx_quotes', ['company_id', 'created_at'], unique=False, postgresql_where=sa.text('NOT is_expired'))
+
+
+def downgrade() -> None:
+    op.drop_index('idx_fx_quotes_company_open_created', table_name='fx_quotes', postgresql_where=sa.text('NOT is_expired'))
+    op.drop_index('idx_beneficiaries_company_active', table_name='beneficiaries', postgresql_where=sa.text('is_active'))
+    op.drop_index('idx_users_company_active', table_name='users', postgresql_where=sa.text('is_active'))
@@ -2,22 +2,127 @@
 Database connection and session management.
 """
 
+from contextlib import contextmanager
+from functools import cache
+from typing import Iterator
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool
 from app.config import config
 
-# Create database engine
-engine = create_engine(
-    config.DATABASE_URL, pool_pre_ping=True, pool_size=5, max_overflow=10
-)
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@cache
+def get_engine() -> Engine:
+    """
+    Create the database engine once per process.
+
+    Streamlit reruns and every page share this engine and its pool.
+
+    Returns:
+        Shared Engine instance
+    """
+    # PostgreSQL-only session settings applied on connect
+    connect_args = {}
+    if config.DATABASE_URL.startswith("postgresql"):
+        connect_args = {
+            "application_name": "flow",
+            "options": f"-c statement_timeout={config.DB_STATEMENT_TIMEOUT_MS}",
+        }
+
+    # QueuePool explicitly, whatever the dialect default; LIFO checkout
+    # reuses the warmest connections and lets surplus ones idle out
+    return create_engine(
+        config.DATABASE_URL,
+        poolclass=QueuePool,
+        pool_use_lifo=True,
+        pool_pre_ping=True,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        connect_args=connect_args,
+    )
+
+
+@cache
+def get_sessionmaker() -> sessionmaker:
+    """
+    Create the session factory once per process.
+
+    expire_on_commit is off so objects stay readable after the service
+    commits, without a refresh SELECT per object.
+
+    Returns:
+        Shared sessionmaker bound to the engine
+    """
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=get_engine(),
+    )
+
+
+@cache
+def get_async_engine() -> AsyncEngine:
+    """
+    Create the asyncio database engine once per process.
+
+    Used by async callers such as AsyncAuthService; the Streamlit pages
+    keep using the synchronous engine. The DATABASE_URL driver is swapped
+    for asyncpg, with the same pool settings.
+
+    Returns:
+        Shared AsyncEngine instance
+    """
+    url = make_url(config.DATABASE_URL).set(drivername="postgresql+asyncpg")
+    return create_async_engine(
+        url,
+        pool_pre_ping=True,
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        connect_args={
+            "server_settings": {
+                "application_name": "flow",
+                "statement_timeout": str(config.DB_STATEMENT_TIMEOUT_MS),
+            }
+        },
+    )
+
+
+@cache
+def get_async_sessionmaker() -> async_sessionmaker:
+    """
+    Create the asyncio session factory once per process.
+
+    Returns:
+        Shared async_sessionmaker bound to the async engine
+    """
+    return async_sessionmaker(
+        autoflush=False,
+        expire_on_commit=False,
+        bind=get_async_engine(),
+    )
+
 
 # Create declarative base
 Base = declarative_base()
 
 
+def __getattr__(name: str):
+    # Resolve `engine` and `SessionLocal` lazily, so importing this module
+    # (e.g. for Base) neither reads the config nor creates the engine
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_db():
     """
     Get database session.
@@ -25,8 +130,48 @@ def get_db():
     Yields:
         Session: Database session
     """
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
         db.close()
+
+
+@contextmanager
+def transaction(db: Session) -> Iterator[Session]:
+    """
+    Run several repository writes on an existing session as one transaction.
+
+    Services wrap an entity write and its audit row in this, so both land
+    with a single commit or neither does.
+
+    Args:
+        db: Database session
+
+    Yields:
+        Session: The same session
+    """
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+@contextmanager
+def unit_of_work() -> Iterator[Session]:
+    """
+    Run several repository writes in a single transaction.
+
+    Commits once when the block completes and rolls back if it raises.
+
+    Yields:
+        Session: Database session
+    """
+    db = get_sessionmaker()()
+    try:
+        with transaction(db):
+            yield db
+    finally:
+        db.close()
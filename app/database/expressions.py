@@ -0,0 +1,32 @@
+"""
+Reusable SQL expressions evaluated by the database server.
+"""
+
+from sqlalchemy import func
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def days_ago(days: int) -> ColumnElement:
+    """
+    Server time minus a number of days, for timestamptz columns.
+
+    Args:
+        days: Number of days to look back
+
+    Returns:
+        SQL expression equivalent to now() - interval 'N days'
+    """
+    return func.now() - func.make_interval(0, 0, 0, days)
+
+
+def utc_now() -> ColumnElement:
+    """
+    Server time as a naive UTC timestamp.
+
+    For comparisons against timestamp-without-time-zone columns that store
+    UTC (e.g. quote_expires_at), independent of the session TimeZone.
+
+    Returns:
+        SQL expression equivalent to now() AT TIME ZONE 'UTC'
+    """
+    return func.timezone("UTC", func.now())
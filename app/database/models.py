@@ -2,8 +2,8 @@
 SQLAlchemy database models.
 """
 
-from datetime import datetime
 from sqlalchemy import (
+    BigInteger,
     Column,
     Integer,
     String,
@@ -14,11 +14,24 @@ from sqlalchemy import (
     Text,
     ForeignKey,
     DECIMAL,
+    Index,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.database.connection import Base
 
+# 64-bit keys for high-volume tables; SQLite only autoincrements INTEGER keys
+BigIntegerKey = BigInteger().with_variant(Integer, "sqlite")
+
+# Fixed-point precision shared by money, rate and percentage columns
+NUMERIC_PRECISION = 18
+MONEY_SCALE = 2
+RATE_SCALE = 8
+PERCENTAGE_PRECISION = 5
+PERCENTAGE_SCALE = 4
+
 
 class User(Base):
     """User model."""
@@ -32,11 +45,24 @@ class User(Base):
     role = Column(String(50), nullable=False)  # 'admin', 'maker', 'approver'
     company_id = Column(Integer, ForeignKey("companies.id"))
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_users_company_active", "company_id", postgresql_where=text("is_active")
+        ),
+    )
 
     # Relationships
-    company = relationship("Company", back_populates="users")
+    company = relationship("Company", back_populates="users", lazy="joined")
 
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}', role='{self.role}')>"
@@ -52,12 +78,31 @@ class Company(Base):
     registered_country = Column(String(2), nullable=False)
     industry_sector = Column(String(100))
     fx_volume_band = Column(String(50))
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        # Trigram index so ILIKE '%term%' name search avoids a sequential scan
+        Index(
+            "idx_companies_name_trgm",
+            "company_name",
+            postgresql_using="gin",
+            postgresql_ops={"company_name": "gin_trgm_ops"},
+        ),
+    )
 
     # Relationships
-    users = relationship("User", back_populates="company")
-    beneficiaries = relationship("Beneficiary", back_populates="company")
+    # Collections stay lazy: they are only needed for summaries, which
+    # request them explicitly with eager-load options
+    users = relationship("User", back_populates="company", lazy="select")
+    beneficiaries = relationship("Beneficiary", back_populates="company", lazy="select")
 
     def __repr__(self):
         return f"<Company(id={self.id}, name='{self.company_name}')>"
@@ -74,12 +119,39 @@ class Beneficiary(Base):
     beneficiary_type = Column(String(50))
     country = Column(String(2), nullable=False)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        # Trigram index so ILIKE '%term%' name search avoids a sequential scan
+        Index(
+            "idx_beneficiaries_name_trgm",
+            "beneficiary_name",
+            postgresql_using="gin",
+            postgresql_ops={"beneficiary_name": "gin_trgm_ops"},
+        ),
+        # Active beneficiaries of a company in name order: serves search,
+        # listing and paging without a separate sort
+        Index(
+            "idx_beneficiaries_company_active_name",
+            "company_id",
+            "beneficiary_name",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     # Relationships
-    company = relationship("Company", back_populates="beneficiaries")
-    bank_accounts = relationship("BeneficiaryBankAccount", back_populates="beneficiary")
+    company = relationship("Company", back_populates="beneficiaries", lazy="select")
+    bank_accounts = relationship(
+        "BeneficiaryBankAccount", back_populates="beneficiary", lazy="selectin"
+    )
 
     def __repr__(self):
         return f"<Beneficiary(id={self.id}, name='{self.beneficiary_name}')>"
@@ -98,10 +170,14 @@ class BeneficiaryBankAccount(Base):
     bank_name = Column(String(255))
     currency = Column(String(3), nullable=False)
     is_default = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Relationships
-    beneficiary = relationship("Beneficiary", back_populates="bank_accounts")
+    beneficiary = relationship(
+        "Beneficiary", back_populates="bank_accounts", lazy="select"
+    )
 
     def __repr__(self):
         return f"<BeneficiaryBankAccount(id={self.id}, currency='{self.currency}')>"
@@ -117,12 +193,34 @@ class FXQuote(Base):
     quote_id = Column(String(100), unique=True)
     source_currency = Column(String(3), nullable=False)
     target_currency = Column(String(3), nullable=False)
-    rate = Column(DECIMAL(18, 8), nullable=False)
-    markup_percentage = Column(DECIMAL(5, 4))
-    final_rate = Column(DECIMAL(18, 8), nullable=False)
+    rate = Column(DECIMAL(NUMERIC_PRECISION, RATE_SCALE), nullable=False)
+    markup_percentage = Column(DECIMAL(PERCENTAGE_PRECISION, PERCENTAGE_SCALE))
+    final_rate = Column(DECIMAL(NUMERIC_PRECISION, RATE_SCALE), nullable=False)
     quote_expires_at = Column(DateTime, nullable=False)
     is_expired = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_fx_quotes_company_open_expiry",
+            "company_id",
+            "quote_expires_at",
+            postgresql_where=text("NOT is_expired"),
+        ),
+        Index(
+            "idx_fx_quotes_open_expiry",
+            "quote_expires_at",
+            postgresql_where=text("NOT is_expired"),
+        ),
+        Index(
+            "idx_fx_quotes_company_open_created",
+            "company_id",
+            "created_at",
+            postgresql_where=text("NOT is_expired"),
+        ),
+    )
 
     def __repr__(self):
         return f"<FXQuote(id={self.id}, {self.source_currency}/{self.target_currency})>"
@@ -133,7 +231,7 @@ class Payment(Base):
 
     __tablename__ = "payments"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntegerKey, primary_key=True, index=True)
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
     created_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     beneficiary_id = Column(Integer, ForeignKey("beneficiaries.id"), nullable=False)
@@ -144,11 +242,11 @@ class Payment(Base):
 
     source_currency = Column(String(3), nullable=False)
     target_currency = Column(String(3), nullable=False)
-    source_amount = Column(DECIMAL(18, 2))
-    target_amount = Column(DECIMAL(18, 2))
-    fx_rate = Column(DECIMAL(18, 8))
-    fee_amount = Column(DECIMAL(18, 2))
-    total_debit = Column(DECIMAL(18, 2))
+    source_amount = Column(DECIMAL(NUMERIC_PRECISION, MONEY_SCALE))
+    target_amount = Column(DECIMAL(NUMERIC_PRECISION, MONEY_SCALE))
+    fx_rate = Column(DECIMAL(NUMERIC_PRECISION, RATE_SCALE))
+    fee_amount = Column(DECIMAL(NUMERIC_PRECISION, MONEY_SCALE))
+    total_debit = Column(DECIMAL(NUMERIC_PRECISION, MONEY_SCALE))
 
     payment_reference = Column(String(255))
     execution_date = Column(Date)
@@ -157,8 +255,28 @@ class Payment(Base):
     external_payment_id = Column(String(100))
     failure_reason = Column(Text)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_payments_company_status_created", "company_id", "status", "created_at"
+        ),
+        Index("idx_payments_created_by", "created_by_user_id"),
+        Index(
+            "idx_payments_company_awaiting",
+            "company_id",
+            "created_at",
+            postgresql_where=text("status IN ('pending_approval', 'approved')"),
+        ),
+    )
 
     def __repr__(self):
         return f"<Payment(id={self.id}, status='{self.status}')>"
@@ -170,11 +288,13 @@ class PaymentApproval(Base):
     __tablename__ = "payment_approvals"
 
     id = Column(Integer, primary_key=True, index=True)
-    payment_id = Column(Integer, ForeignKey("payments.id"), nullable=False)
+    payment_id = Column(BigIntegerKey, ForeignKey("payments.id"), nullable=False)
     approver_user_id = Column(Integer, ForeignKey("users.id"))
     action = Column(String(50), nullable=False)
     comments = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     def __repr__(self):
         return f"<PaymentApproval(id={self.id}, action='{self.action}')>"
@@ -185,15 +305,24 @@ class AuditLog(Base):
 
     __tablename__ = "audit_logs"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntegerKey, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     entity_type = Column(String(50), nullable=False)
-    entity_id = Column(Integer, nullable=False)
+    entity_id = Column(BigIntegerKey, nullable=False)
     action = Column(String(50), nullable=False)
     old_values = Column(JSONB)
     new_values = Column(JSONB)
     ip_address = Column(String(45))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        Index("idx_audit_logs_entity", "entity_type", "entity_id", "created_at"),
+        Index("idx_audit_logs_user_created", "user_id", "created_at"),
+        Index("idx_audit_logs_action_created", "action", "created_at"),
+        Index("idx_audit_logs_created_at", "created_at"),
+    )
 
     def __repr__(self):
         return f"<AuditLog(id={self.id}, action='{self.action}')>"
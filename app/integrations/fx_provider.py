@@ -4,13 +4,114 @@ FX provider integrations for sandbox/testing.
 Includes:
 - MockFXProvider: Simulated rates for testing
 - FixerIOProvider: Real delayed rates from Fixer.io API
+- AsyncFixerIOProvider: Async Fixer.io client for concurrent pair lookups
 """
 
+import asyncio
+import logging
 import random
-import requests
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, Dict
-from decimal import Decimal
+from itertools import permutations, product
+from typing import Optional, Dict, Tuple
+from decimal import Context, Decimal, ROUND_HALF_EVEN
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Arithmetic context for rate math, sized to the DECIMAL(18, 8) rate columns.
+# Used explicitly rather than installed with setcontext() so other modules
+# keep the default thread context.
+_CTX = Context(prec=18, rounding=ROUND_HALF_EVEN)
+
+# Shared Decimal constants, built once instead of parsed on every call
+_ONE = Decimal(1)
+_PAR_RATE = Decimal("1.0000")  # Same-currency rate at display precision
+_Q8 = Decimal("0.00000001")
+_Q4 = Decimal("0.0001")
+_Q2 = Decimal("0.01")
+
+# Mock fluctuation is drawn as an integer in parts-per-million
+_FLUCT_EXPONENT = -6
+
+# Fixer.io EUR rate tables keyed by base URL. Module-level so the sync and
+# async providers share the same warm entries.
+_FIXER_RATES_TTL = 1800  # 30 minutes (free tier has ~60 min delay anyway)
+_FIXER_RATES_CACHE = TTLCache(maxsize=4, ttl=_FIXER_RATES_TTL)
+_FIXER_RATES_LOCK = threading.RLock()
+
+
+def _parse_fixer_rates(data: Dict) -> Optional[Dict[str, Decimal]]:
+    """
+    Parse a Fixer.io /latest response into a EUR-based rate table.
+
+    Args:
+        data: Decoded JSON response body
+
+    Returns:
+        Mapping of currency code to units per 1 EUR, or None on API error
+    """
+    if not data.get("success", False):
+        error_info = data.get("error", {})
+        logger.warning("Fixer.io API error: %s", error_info)
+        return None
+
+    rates = {code: Decimal(str(value)) for code, value in data.get("rates", {}).items()}
+    rates["EUR"] = _ONE
+    return rates
+
+
+def _fixer_cross_rate(
+    rates: Dict[str, Decimal], from_currency: str, to_currency: str
+) -> Optional[Decimal]:
+    """
+    Derive a pair rate from a EUR-based rate table.
+
+    Fixer.io free plan only supports EUR as base currency, so every pair
+    is a cross rate: (1 EUR = X FROM) and (1 EUR = Y TO), so 1 FROM = Y/X TO
+    """
+    if from_currency not in rates or to_currency not in rates:
+        logger.warning("Rates not found for %s/%s", from_currency, to_currency)
+        return None
+
+    try:
+        return _CTX.divide(rates[to_currency], rates[from_currency]).quantize(
+            _Q8, context=_CTX
+        )
+    except ZeroDivisionError as e:
+        logger.warning("Error parsing Fixer.io response: %s", e)
+        return None
+
+
+def _fixer_quote(
+    from_currency: str,
+    to_currency: str,
+    rate: Decimal,
+    amount: Optional[Decimal],
+    validity_seconds: int,
+) -> Dict:
+    """Build a Fixer.io quote dictionary for a resolved rate."""
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=validity_seconds)
+
+    quote = {
+        "quote_id": (
+            f"FIXER-{now.strftime('%Y%m%d%H%M%S')}-{random.randint(1000, 9999)}"
+        ),
+        "from_currency": from_currency,
+        "to_currency": to_currency,
+        "rate": rate,
+        "timestamp": now,
+        "expires_at": expires_at,
+        "validity_seconds": validity_seconds,
+        "provider": "fixer.io",
+    }
+
+    if amount is not None:
+        quote["amount"] = amount
+        quote["converted_amount"] = amount * rate
+
+    return quote
 
 
 class MockFXProvider:
@@ -33,16 +134,33 @@ class MockFXProvider:
         "CZK": Decimal("28.50"),
     }
 
-    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None):
+    # Cross rates and pairs are fixed, so derive them once at import time
+    _CROSS_RATES: Dict[Tuple[str, str], Decimal] = {
+        (from_curr, to_curr): to_rate / from_rate
+        for (from_curr, from_rate), (to_curr, to_rate) in product(
+            BASE_RATES.items(), repeat=2
+        )
+    }
+    _PAIRS = tuple(permutations(BASE_RATES, 2))
+    _SUPPORTED = frozenset(BASE_RATES)
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
         """
         Initialize FX provider.
 
         Args:
             api_key: API key for authentication (unused in mock)
             api_url: API endpoint URL (unused in mock)
+            seed: Optional seed for reproducible rate jitter and quote IDs
         """
         self.api_key = api_key
         self.api_url = api_url
+        self._rng = random.Random(seed)
 
     def get_rate(
         self, from_currency: str, to_currency: str, amount: Optional[Decimal] = None
@@ -65,9 +183,9 @@ class MockFXProvider:
         to_currency = to_currency.upper()
 
         # Validate currencies
-        if from_currency not in self.BASE_RATES:
+        if from_currency not in self._SUPPORTED:
             raise ValueError(f"Unsupported source currency: {from_currency}")
-        if to_currency not in self.BASE_RATES:
+        if to_currency not in self._SUPPORTED:
             raise ValueError(f"Unsupported target currency: {to_currency}")
 
         # Same currency
@@ -75,28 +193,35 @@ class MockFXProvider:
             return {
                 "from_currency": from_currency,
                 "to_currency": to_currency,
-                "rate": Decimal("1.0000"),
-                "inverse_rate": Decimal("1.0000"),
+                "rate": _PAR_RATE,
+                "inverse_rate": _PAR_RATE,
                 "timestamp": datetime.utcnow().isoformat(),
                 "provider": "MockFX",
             }
 
+        # No per-pair cache here: cross rates are precomputed in _CROSS_RATES
+        # and FXService reuses live rates per pair for a few seconds
+
         # Calculate cross rate with slight random variation
         # This simulates real-time market fluctuations
-        base_rate = self.BASE_RATES[to_currency] / self.BASE_RATES[from_currency]
+        base_rate = self._CROSS_RATES[(from_currency, to_currency)]
 
         # Add small random fluctuation (±0.5%)
-        fluctuation = Decimal(str(random.uniform(-0.005, 0.005)))
-        rate = base_rate * (Decimal("1.0") + fluctuation)
+        fluctuation = Decimal(self._rng.randint(-5000, 5000)).scaleb(
+            _FLUCT_EXPONENT, _CTX
+        )
 
         # Round to appropriate decimal places
-        rate = rate.quantize(Decimal("0.0001"))
+        rate = _CTX.multiply(base_rate, _CTX.add(_ONE, fluctuation)).quantize(
+            _Q4, context=_CTX
+        )
+        inverse_rate = _CTX.divide(_ONE, rate).quantize(_Q4, context=_CTX)
 
         result = {
             "from_currency": from_currency,
             "to_currency": to_currency,
             "rate": rate,
-            "inverse_rate": (Decimal("1.0") / rate).quantize(Decimal("0.0001")),
+            "inverse_rate": inverse_rate,
             "timestamp": datetime.utcnow().isoformat(),
             "provider": "MockFX",
         }
@@ -104,7 +229,9 @@ class MockFXProvider:
         # If amount provided, calculate converted amount
         if amount:
             result["source_amount"] = amount
-            result["target_amount"] = (amount * rate).quantize(Decimal("0.01"))
+            result["target_amount"] = _CTX.multiply(amount, rate).quantize(
+                _Q2, context=_CTX
+            )
 
         return result
 
@@ -130,7 +257,10 @@ class MockFXProvider:
         rate_info = self.get_rate(from_currency, to_currency, amount)
 
         # Generate mock quote ID
-        quote_id = f"MFX-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{random.randint(1000, 9999)}"
+        quote_id = (
+            f"MFX-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+            f"-{self._rng.randint(1000, 9999)}"
+        )
 
         quote = {
             "quote_id": quote_id,
@@ -157,7 +287,7 @@ class MockFXProvider:
         Returns:
             True if supported, False otherwise
         """
-        return currency_code.upper() in self.BASE_RATES
+        return currency_code.upper() in self._SUPPORTED
 
     def get_supported_currencies(self) -> list:
         """
@@ -175,13 +305,7 @@ class MockFXProvider:
         Returns:
             List of tuples (from_currency, to_currency)
         """
-        currencies = self.get_supported_currencies()
-        pairs = []
-        for from_curr in currencies:
-            for to_curr in currencies:
-                if from_curr != to_curr:
-                    pairs.append((from_curr, to_curr))
-        return pairs
+        return list(self._PAIRS)
 
 
 class FixerIOProvider:
@@ -207,12 +331,32 @@ class FixerIOProvider:
 
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
-        self._cache = {}  # Simple cache to reduce API calls
-        self._cache_ttl = (
-            1800  # 30 minutes cache for rates (free tier has ~60 min delay anyway)
+
+        # Imported here so mock-only deployments never load the HTTP stack
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # Persistent session so keep-alive connections are reused across calls
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=2, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504]
+            ),
         )
-        self._currencies_cache = None  # Cache for supported currencies
-        self._currencies_cache_time = None  # When currencies were cached
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._cache_ttl = _FIXER_RATES_TTL
+        # Bounded caches to reduce API calls; entries expire and evict on insert.
+        # The EUR table itself lives in the module-level _FIXER_RATES_CACHE.
+        self._cache = TTLCache(maxsize=512, ttl=self._cache_ttl)  # pair -> rate
+        self._currencies_cache = TTLCache(maxsize=1, ttl=86400)  # 24 hours
+        self._last_currencies = None  # Last good list, served if the API fails
+        # TTLCache is not thread-safe and the provider may be shared
+        self._cache_lock = threading.RLock()
 
         # Common currencies as fallback when API is rate limited
         self._common_currencies = [
@@ -250,6 +394,16 @@ class FixerIOProvider:
             "ZAR",
         ]
 
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "FixerIOProvider":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def get_rate(self, from_currency: str, to_currency: str) -> Optional[Decimal]:
         """
         Get current exchange rate from Fixer.io.
@@ -263,80 +417,69 @@ class FixerIOProvider:
         """
         # Check cache first
         cache_key = f"{from_currency}_{to_currency}"
-        if cache_key in self._cache:
-            cached_data, cached_time = self._cache[cache_key]
-            if (datetime.utcnow() - cached_time).total_seconds() < self._cache_ttl:
-                return cached_data
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        try:
-            # Fixer.io free plan only supports EUR as base currency
-            # We need to convert from EUR to get other currency pairs
-            url = f"{self.base_url}/latest"
-
-            # If from_currency is EUR, we can query directly
-            if from_currency == "EUR":
-                params = {"access_key": self.api_key, "symbols": to_currency}
-
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
+        rates = self._fetch_all_eur_rates()
+        if rates is None:
+            return None
 
-                if not data.get("success", False):
-                    error_info = data.get("error", {})
-                    print(f"Fixer.io API error: {error_info}")
-                    return None
+        rate = _fixer_cross_rate(rates, from_currency, to_currency)
+        if rate is None:
+            return None
 
-                rates = data.get("rates", {})
-                if to_currency not in rates:
-                    print(f"Rate not found for EUR/{to_currency}")
-                    return None
+        # Cache the result
+        with self._cache_lock:
+            self._cache[cache_key] = rate
 
-                rate = Decimal(str(rates[to_currency]))
+        return rate
 
-            else:
-                # For non-EUR base, we need to fetch both currencies and calculate cross-rate
-                params = {
-                    "access_key": self.api_key,
-                    "symbols": f"{from_currency},{to_currency}",
-                }
+    def _fetch_all_eur_rates(self) -> Optional[Dict[str, Decimal]]:
+        """
+        Get the full EUR-based rate table, fetching it at most once per TTL.
 
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
+        One /latest call returns every symbol, so all currency pairs in the
+        cache window share a single request against the monthly quota.
 
-                if not data.get("success", False):
-                    error_info = data.get("error", {})
-                    print(f"Fixer.io API error: {error_info}")
-                    return None
+        Returns:
+            Mapping of currency code to units per 1 EUR, or None if unavailable
+        """
+        import requests
 
-                rates = data.get("rates", {})
+        with _FIXER_RATES_LOCK:
+            cached = _FIXER_RATES_CACHE.get(self.base_url)
+        if cached is not None:
+            return cached
 
-                if from_currency not in rates or to_currency not in rates:
-                    print(f"Rates not found for {from_currency}/{to_currency}")
-                    return None
+        try:
+            url = f"{self.base_url}/latest"
+            params = {"access_key": self.api_key}
 
-                # Calculate cross rate: (1 EUR = X FROM) and (1 EUR = Y TO)
-                # So: 1 FROM = Y/X TO
-                from_rate = Decimal(str(rates[from_currency]))
-                to_rate = Decimal(str(rates[to_currency]))
-                rate = (to_rate / from_rate).quantize(Decimal("0.00000001"))
+            response = self._session.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            rates = _parse_fixer_rates(response.json())
+            if rates is None:
+                return None
 
-            # Cache the result
-            self._cache[cache_key] = (rate, datetime.utcnow())
+            with _FIXER_RATES_LOCK:
+                _FIXER_RATES_CACHE[self.base_url] = rates
 
-            return rate
+            return rates
 
         except requests.RequestException as e:
             error_msg = str(e)
             if "429" in error_msg:
-                print(
-                    f"Fixer.io rate limit exceeded. Using cached rates if available or try again later."
+                logger.warning(
+                    "Fixer.io rate limit exceeded. "
+                    "Using cached rates if available or try again later."
                 )
             else:
-                print(f"Error fetching rate from Fixer.io: {e}")
+                logger.warning("Error fetching rate from Fixer.io: %s", e)
             return None
-        except (ValueError, KeyError, ZeroDivisionError) as e:
-            print(f"Error parsing Fixer.io response: {e}")
+        except (ValueError, KeyError, ArithmeticError) as e:
+            logger.warning("Error parsing Fixer.io response: %s", e)
             return None
 
     def get_quote(
@@ -363,25 +506,7 @@ class FixerIOProvider:
         if rate is None:
             return None
 
-        now = datetime.utcnow()
-        expires_at = now + timedelta(seconds=validity_seconds)
-
-        quote = {
-            "quote_id": f"FIXER-{now.strftime('%Y%m%d%H%M%S')}-{random.randint(1000, 9999)}",
-            "from_currency": from_currency,
-            "to_currency": to_currency,
-            "rate": rate,
-            "timestamp": now,
-            "expires_at": expires_at,
-            "validity_seconds": validity_seconds,
-            "provider": "fixer.io",
-        }
-
-        if amount is not None:
-            quote["amount"] = amount
-            quote["converted_amount"] = amount * rate
-
-        return quote
+        return _fixer_quote(from_currency, to_currency, rate, amount, validity_seconds)
 
     def get_supported_currencies(self) -> list:
         """
@@ -391,55 +516,199 @@ class FixerIOProvider:
         Returns:
             List of currency codes
         """
+        import requests
+
         # Check if we have a cached list (cache for 24 hours)
-        if (
-            self._currencies_cache is not None
-            and self._currencies_cache_time is not None
-        ):
-            time_since_cache = (
-                datetime.utcnow() - self._currencies_cache_time
-            ).total_seconds()
-            if time_since_cache < 86400:  # 24 hours
-                return self._currencies_cache
+        with self._cache_lock:
+            cached = self._currencies_cache.get("symbols")
+        if cached is not None:
+            return cached
 
         try:
             url = f"{self.base_url}/symbols"
             params = {"access_key": self.api_key}
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
 
             if not data.get("success", False):
                 # Return cached or fallback currencies
-                return (
-                    self._currencies_cache
-                    if self._currencies_cache
-                    else self._common_currencies
-                )
+                return self._last_currencies or self._common_currencies
 
             symbols = data.get("symbols", {})
             currencies = list(symbols.keys())
 
             # Update cache
-            self._currencies_cache = currencies
-            self._currencies_cache_time = datetime.utcnow()
+            with self._cache_lock:
+                self._currencies_cache["symbols"] = currencies
+            self._last_currencies = currencies
 
             return currencies
 
         except requests.RequestException as e:
             error_msg = str(e)
             if "429" in error_msg:
-                print(
-                    f"Fixer.io rate limit for currencies. Using cached/fallback list."
+                logger.warning(
+                    "Fixer.io rate limit for currencies. Using cached/fallback list."
                 )
             else:
-                print(f"Error fetching currencies from Fixer.io: {e}")
+                logger.warning("Error fetching currencies from Fixer.io: %s", e)
 
             # Return cached currencies if available, otherwise use common currencies
-            return (
-                self._currencies_cache
-                if self._currencies_cache
-                else self._common_currencies
-            )
+            return self._last_currencies or self._common_currencies
+
+
+class AsyncFixerIOProvider:
+    """
+    Async Fixer.io FX rate provider.
+
+    Mirrors FixerIOProvider on top of httpx.AsyncClient so async callers can
+    asyncio.gather many pair lookups. Shares the EUR rate table cache with
+    the sync provider, so a warm table serves both code paths.
+    """
+
+    def __init__(self, api_key: str, base_url: str = "http://data.fixer.io/api"):
+        """
+        Initialize async Fixer.io provider.
+
+        Args:
+            api_key: Fixer.io API access key
+            base_url: Base URL for Fixer.io API (default: http://data.fixer.io/api)
+        """
+        if not api_key:
+            raise ValueError("Fixer.io API key is required")
+
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+
+        # Imported here so sync-only deployments never load httpx
+        import httpx
+
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        )
+        # Gathered lookups that all miss the cache wait on one table fetch
+        self._fetch_lock = asyncio.Lock()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncFixerIOProvider":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def get_rate(self, from_currency: str, to_currency: str) -> Optional[Decimal]:
+        """
+        Get current exchange rate from Fixer.io.
+
+        Args:
+            from_currency: Source currency code (e.g., 'GBP')
+            to_currency: Target currency code (e.g., 'EUR')
+
+        Returns:
+            Exchange rate as Decimal, or None if unavailable
+        """
+        rates = await self._fetch_all_eur_rates()
+        if rates is None:
+            return None
+
+        return _fixer_cross_rate(rates, from_currency, to_currency)
+
+    async def get_rates(self, pairs: list) -> Dict[Tuple[str, str], Optional[Decimal]]:
+        """
+        Get exchange rates for several currency pairs concurrently.
+
+        Args:
+            pairs: List of (from_currency, to_currency) tuples
+
+        Returns:
+            Mapping of pair to rate (None where unavailable)
+        """
+        rates = await asyncio.gather(
+            *(self.get_rate(from_ccy, to_ccy) for from_ccy, to_ccy in pairs)
+        )
+        return dict(zip(pairs, rates))
+
+    async def get_quote(
+        self,
+        from_currency: str,
+        to_currency: str,
+        amount: Optional[Decimal] = None,
+        validity_seconds: int = 120,
+    ) -> Optional[Dict]:
+        """
+        Get FX quote with validity period.
+
+        Args:
+            from_currency: Source currency code
+            to_currency: Target currency code
+            amount: Optional amount for conversion calculation
+            validity_seconds: Quote validity in seconds (default: 120)
+
+        Returns:
+            Quote dictionary with rate, timestamp, expiry, etc.
+        """
+        rate = await self.get_rate(from_currency, to_currency)
+
+        if rate is None:
+            return None
+
+        return _fixer_quote(from_currency, to_currency, rate, amount, validity_seconds)
+
+    async def _fetch_all_eur_rates(self) -> Optional[Dict[str, Decimal]]:
+        """
+        Get the full EUR-based rate table, fetching it at most once per TTL.
+
+        Returns:
+            Mapping of currency code to units per 1 EUR, or None if unavailable
+        """
+        import httpx
+
+        with _FIXER_RATES_LOCK:
+            cached = _FIXER_RATES_CACHE.get(self.base_url)
+        if cached is not None:
+            return cached
+
+        async with self._fetch_lock:
+            # Another task may have filled the cache while we waited
+            with _FIXER_RATES_LOCK:
+                cached = _FIXER_RATES_CACHE.get(self.base_url)
+            if cached is not None:
+                return cached
+
+            try:
+                response = await self._client.get(
+                    "/latest", params={"access_key": self.api_key}
+                )
+                response.raise_for_status()
+                rates = _parse_fixer_rates(response.json())
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 429:
+                    logger.warning(
+                        "Fixer.io rate limit exceeded. "
+                        "Using cached rates if available or try again later."
+                    )
+                else:
+                    logger.warning("Error fetching rate from Fixer.io: %s", e)
+                return None
+            except httpx.HTTPError as e:
+                logger.warning("Error fetching rate from Fixer.io: %s", e)
+                return None
+            except (ValueError, KeyError, ArithmeticError) as e:
+                logger.warning("Error parsing Fixer.io response: %s", e)
+                return None
+
+            if rates is None:
+                return None
+
+            with _FIXER_RATES_LOCK:
+                _FIXER_RATES_CACHE[self.base_url] = rates
+
+            return rates
@@ -1,3 +1,6 @@
 """
 Data access layer repositories.
+
+Repositories stage changes and flush() them but never commit; the calling
+service (or a unit_of_work() block) owns the transaction boundary.
 """
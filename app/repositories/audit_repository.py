@@ -2,34 +2,111 @@
 Audit log repository for database operations.
 """
 
-from typing import Optional, List
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, List, Union
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import desc, func, insert, lambda_stmt, select
+from app.database.expressions import days_ago
 from app.database.models import AuditLog
 
 
+@dataclass(slots=True)
+class AuditEntry:
+    """An audit log row to be written."""
+
+    user_id: Optional[int]
+    entity_type: str
+    entity_id: int
+    action: str
+    old_values: Optional[Dict[str, Any]] = None
+    new_values: Optional[Dict[str, Any]] = None
+    ip_address: Optional[str] = None
+
+    def to_row(self) -> Dict[str, Any]:
+        """
+        Convert to insert parameters.
+
+        Unset optional fields are left out, so they are stored as NULL.
+
+        Returns:
+            Dictionary of audit log column values
+        """
+        row = {
+            "user_id": self.user_id,
+            "entity_type": self.entity_type,
+            "entity_id": self.entity_id,
+            "action": self.action,
+        }
+        if self.old_values is not None:
+            row["old_values"] = self.old_values
+        if self.new_values is not None:
+            row["new_values"] = self.new_values
+        if self.ip_address is not None:
+            row["ip_address"] = self.ip_address
+        return row
+
+
+# Repository writes accept either an AuditEntry or a plain column dict
+AuditData = Union[AuditEntry, Dict[str, Any]]
+
+
+def _as_row(audit_data: AuditData) -> Dict[str, Any]:
+    if isinstance(audit_data, AuditEntry):
+        return audit_data.to_row()
+    return audit_data
+
+
 class AuditRepository:
     """Repository for audit log database operations."""
 
     def __init__(self, db: Session):
         self.db = db
 
-    def create(self, audit_data: dict) -> AuditLog:
+    def create(self, audit_data: AuditData) -> AuditLog:
         """
         Create a new audit log entry.
 
+        Issues a single INSERT ... RETURNING for the generated columns,
+        bypassing the unit of work.
+
         Args:
-            audit_data: Dictionary containing audit log data
+            audit_data: AuditEntry or dictionary containing audit log data
 
         Returns:
-            Created audit log object
+            Created audit log object (not attached to the session)
         """
-        audit_log = AuditLog(**audit_data)
-        self.db.add(audit_log)
-        self.db.commit()
-        self.db.refresh(audit_log)
-        return audit_log
+        audit_data = _as_row(audit_data)
+        row = self.db.execute(
+            insert(AuditLog)
+            .values(**audit_data)
+            .returning(AuditLog.id, AuditLog.created_at)
+        ).one()
+        return AuditLog(id=row.id, created_at=row.created_at, **audit_data)
+
+    def create_many(self, audit_rows: List[AuditData]) -> None:
+        """
+        Insert several audit log entries in one round trip.
+
+        A Core INSERT executed with a list of parameter sets, which
+        PostgreSQL receives as a multi-row VALUES statement; rows that
+        leave different optional columns unset go in separate statements.
+        No ORM objects are built and the generated IDs are not fetched back.
+
+        Args:
+            audit_rows: List of AuditEntry objects or audit log dictionaries
+        """
+        if not audit_rows:
+            return
+        # Every parameter set of an executemany must carry the same keys.
+        # Filling absent ones with None would store JSON 'null' in the
+        # JSONB columns rather than SQL NULL, so rows are grouped by the
+        # keys they set and each group is inserted separately.
+        groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for row in map(_as_row, audit_rows):
+            groups.setdefault(frozenset(row), []).append(row)
+        for rows in groups.values():
+            self.db.execute(insert(AuditLog), rows)
 
     def get_by_entity(
         self, entity_type: str, entity_id: int, limit: int = 100
@@ -45,13 +122,53 @@ class AuditRepository:
         Returns:
             List of audit log entries
         """
-        return (
-            self.db.query(AuditLog)
-            .filter(
-                AuditLog.entity_type == entity_type, AuditLog.entity_id == entity_id
-            )
+        stmt = lambda_stmt(
+            lambda: select(AuditLog)
+            .where(AuditLog.entity_type == entity_type, AuditLog.entity_id == entity_id)
             .order_by(desc(AuditLog.created_at))
             .limit(limit)
+        )
+        return self.db.execute(stmt).scalars().all()
+
+    def get_by_entities(
+        self, entity_type: str, entity_ids: List[int], per_entity_limit: int = 1
+    ) -> List[AuditLog]:
+        """
+        Get the latest audit logs for several entities in one query.
+
+        Ranks each entity's entries with row_number() and keeps the newest
+        per_entity_limit of each.
+
+        Args:
+            entity_type: Type of entity (e.g., 'payment', 'beneficiary')
+            entity_ids: Entity IDs
+            per_entity_limit: Maximum number of records per entity
+
+        Returns:
+            List of audit log entries, grouped by entity, newest first
+        """
+        if not entity_ids:
+            return []
+
+        entity_rank = (
+            func.row_number()
+            .over(partition_by=AuditLog.entity_id, order_by=desc(AuditLog.created_at))
+            .label("entity_rank")
+        )
+        ranked = (
+            select(AuditLog, entity_rank)
+            .where(
+                AuditLog.entity_type == entity_type,
+                AuditLog.entity_id.in_(entity_ids),
+            )
+            .subquery()
+        )
+        ranked_log = aliased(AuditLog, ranked)
+
+        return (
+            self.db.query(ranked_log)
+            .filter(ranked.c.entity_rank <= per_entity_limit)
+            .order_by(ranked_log.entity_id, desc(ranked_log.created_at))
             .all()
         )
 
@@ -66,13 +183,13 @@ class AuditRepository:
         Returns:
             List of audit log entries
         """
-        return (
-            self.db.query(AuditLog)
-            .filter(AuditLog.user_id == user_id)
+        stmt = lambda_stmt(
+            lambda: select(AuditLog)
+            .where(AuditLog.user_id == user_id)
             .order_by(desc(AuditLog.created_at))
             .limit(limit)
-            .all()
         )
+        return self.db.execute(stmt).scalars().all()
 
     def get_recent(
         self, days: int = 7, entity_type: Optional[str] = None, limit: int = 100
@@ -88,7 +205,7 @@ class AuditRepository:
         Returns:
             List of recent audit log entries
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        cutoff_date = days_ago(days)
         query = self.db.query(AuditLog).filter(AuditLog.created_at >= cutoff_date)
 
         if entity_type:
@@ -116,3 +233,44 @@ class AuditRepository:
             query = query.filter(AuditLog.entity_type == entity_type)
 
         return query.order_by(desc(AuditLog.created_at)).limit(limit).all()
+
+    def stream_recent(
+        self,
+        days: int = 7,
+        entity_type: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[RowMapping]:
+        """
+        Stream recent audit log rows for exports and reports.
+
+        Rows are fetched in batches from a server-side cursor as plain
+        mappings of the summary columns, skipping ORM hydration and the
+        JSONB value columns.
+
+        Args:
+            days: Number of days to look back
+            entity_type: Optional entity type filter
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Row mappings with id, user_id, entity_type, entity_id, action,
+            ip_address and created_at
+        """
+        cutoff_date = days_ago(days)
+        stmt = select(
+            AuditLog.id,
+            AuditLog.user_id,
+            AuditLog.entity_type,
+            AuditLog.entity_id,
+            AuditLog.action,
+            AuditLog.ip_address,
+            AuditLog.created_at,
+        ).where(AuditLog.created_at >= cutoff_date)
+
+        if entity_type:
+            stmt = stmt.where(AuditLog.entity_type == entity_type)
+
+        stmt = stmt.order_by(desc(AuditLog.created_at)).execution_options(
+            yield_per=batch_size
+        )
+        yield from self.db.execute(stmt).mappings()
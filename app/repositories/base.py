@@ -0,0 +1,160 @@
+"""
+Generic base repository with the shared CRUD operations.
+"""
+
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Generic,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+from sqlalchemy import inspect, lambda_stmt, select, update
+from sqlalchemy.orm import Session
+from app.database.connection import Base
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+# Columns update() never writes: keys and creation timestamps are immutable
+_IMMUTABLE_COLUMNS = frozenset({"id", "created_at"})
+
+
+class BaseRepository(Generic[ModelT]):
+    """
+    Repository for the CRUD operations every entity shares.
+
+    Subclasses set ``model`` and add their domain-specific queries.
+    Writes are flushed, never committed; the calling service owns the
+    transaction.
+    """
+
+    __slots__ = ("db",)
+
+    model: Type[ModelT]
+    _UPDATABLE: ClassVar[FrozenSet[str]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "model" in cls.__dict__:
+            cls._UPDATABLE = (
+                frozenset(cls.model.__table__.columns.keys()) - _IMMUTABLE_COLUMNS
+            )
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_by_id(self, entity_id: int) -> Optional[ModelT]:
+        """
+        Get entity by ID.
+
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            Entity object if found, None otherwise
+        """
+        model = self.model
+        stmt = lambda_stmt(lambda: select(model).where(model.id == entity_id))
+        return self.db.execute(stmt).scalar_one_or_none()
+
+    def create(self, data: dict) -> ModelT:
+        """
+        Create a new entity.
+
+        Args:
+            data: Dictionary containing entity data
+
+        Returns:
+            Created entity object, with its generated ID populated
+        """
+        entity = self.model(**data)
+        self.db.add(entity)
+        self.db.flush()
+        return entity
+
+    def update(self, entity_id: int, data: dict) -> Optional[ModelT]:
+        """
+        Update an entity.
+
+        Unknown and immutable keys in data are ignored.
+
+        Args:
+            entity_id: Entity ID
+            data: Dictionary containing updated entity data
+
+        Returns:
+            Updated entity object if found, None otherwise
+        """
+        values = {k: v for k, v in data.items() if k in self._UPDATABLE}
+        if not values:
+            return self.get_by_id(entity_id)
+
+        # One UPDATE ... RETURNING; populate_existing refreshes a copy
+        # already loaded in this session
+        return self.db.scalars(
+            update(self.model)
+            .where(self.model.id == entity_id)
+            .values(**values)
+            .returning(self.model),
+            execution_options={"populate_existing": True},
+        ).one_or_none()
+
+    def update_with_changes(
+        self, entity_id: int, data: dict
+    ) -> Tuple[Optional[ModelT], Dict[str, Any]]:
+        """
+        Update an entity and report the previous value of each changed column.
+
+        For audited updates: the entity is loaded once and modified in the
+        session, and the old values come from the attribute history, so no
+        separate snapshot query is needed. Columns set to their current
+        value are not reported, and nothing is written if none changed.
+
+        Args:
+            entity_id: Entity ID
+            data: Dictionary containing updated entity data
+
+        Returns:
+            Tuple of (updated entity or None if not found, {column: old value})
+        """
+        entity = self.get_by_id(entity_id)
+        if not entity:
+            return None, {}
+
+        values = {k: v for k, v in data.items() if k in self._UPDATABLE}
+        for key, value in values.items():
+            setattr(entity, key, value)
+
+        # History is reset by the flush, so read it first. A column that
+        # was NULL has no deleted entry.
+        attrs = inspect(entity).attrs
+        changes = {}
+        for key in values:
+            history = attrs[key].history
+            if history.has_changes():
+                changes[key] = history.deleted[0] if history.deleted else None
+        if changes:
+            self.db.flush()
+        return entity, changes
+
+    def delete(self, entity_id: int) -> bool:
+        """
+        Delete an entity.
+
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        entity = self.get_by_id(entity_id)
+        if not entity:
+            return False
+
+        self.db.delete(entity)
+        self.db.flush()
+        return True
@@ -2,21 +2,33 @@
 Beneficiary repository for database operations.
 """
 
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from typing import Iterator, Optional, List
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query, selectinload
+from sqlalchemy import func, or_, select
 from app.database.models import Beneficiary, BeneficiaryBankAccount
+from app.repositories.base import BaseRepository
 
 
-class BeneficiaryRepository:
+class BeneficiaryRepository(BaseRepository[Beneficiary]):
     """Repository for beneficiary database operations."""
 
-    def __init__(self, db: Session):
-        self.db = db
+    __slots__ = ()
 
-    def get_by_id(self, beneficiary_id: int) -> Optional[Beneficiary]:
+    model = Beneficiary
+
+    # Columns returned by list_summaries()
+    _SUMMARY_COLUMNS = (
+        Beneficiary.id,
+        Beneficiary.beneficiary_name,
+        Beneficiary.beneficiary_type,
+        Beneficiary.country,
+        Beneficiary.is_active,
+    )
+
+    def get_by_id_with_accounts(self, beneficiary_id: int) -> Optional[Beneficiary]:
         """
-        Get beneficiary by ID.
+        Get beneficiary by ID with its bank accounts loaded.
 
         Args:
             beneficiary_id: Beneficiary ID
@@ -25,7 +37,9 @@ class BeneficiaryRepository:
             Beneficiary object if found, None otherwise
         """
         return (
-            self.db.query(Beneficiary).filter(Beneficiary.id == beneficiary_id).first()
+            self._with_accounts(self.db.query(Beneficiary))
+            .filter(Beneficiary.id == beneficiary_id)
+            .first()
         )
 
     def get_by_company(
@@ -41,53 +55,113 @@ class BeneficiaryRepository:
         Returns:
             List of beneficiaries
         """
-        query = self.db.query(Beneficiary).filter(Beneficiary.company_id == company_id)
+        return self._company_query(company_id, include_inactive).all()
+
+    def get_company_page(
+        self,
+        company_id: int,
+        page: int = 0,
+        page_size: int = 50,
+        include_inactive: bool = False,
+    ) -> List[Beneficiary]:
+        """
+        Get one page of beneficiaries for a company, ordered by name.
 
-        if not include_inactive:
-            query = query.filter(Beneficiary.is_active == True)
+        Args:
+            company_id: Company ID
+            page: Zero-based page number
+            page_size: Number of beneficiaries per page
+            include_inactive: Whether to include inactive beneficiaries
+
+        Returns:
+            List of beneficiaries on the page
+        """
+        return (
+            self._company_query(company_id, include_inactive)
+            .order_by(Beneficiary.beneficiary_name, Beneficiary.id)
+            .offset(page * page_size)
+            .limit(page_size)
+            .all()
+        )
+
+    def stream_by_company(
+        self,
+        company_id: int,
+        include_inactive: bool = True,
+        batch_size: int = 1000,
+    ) -> Iterator[Beneficiary]:
+        """
+        Stream beneficiaries for a company for exports and reports.
+
+        Beneficiaries and their bank accounts are fetched batch by batch
+        from a server-side cursor instead of being materialized as one list.
+
+        Args:
+            company_id: Company ID
+            include_inactive: Whether to include inactive beneficiaries
+            batch_size: Number of rows fetched per round trip
 
-        return query.all()
+        Yields:
+            Beneficiary objects
+        """
+        yield from (
+            self._company_query(company_id, include_inactive)
+            .order_by(Beneficiary.id)
+            .yield_per(batch_size)
+        )
 
-    def create(self, beneficiary_data: dict) -> Beneficiary:
+    def count_by_company(self, company_id: int, include_inactive: bool = False) -> int:
         """
-        Create a new beneficiary.
+        Count beneficiaries for a company without loading them.
 
         Args:
-            beneficiary_data: Dictionary containing beneficiary data
+            company_id: Company ID
+            include_inactive: Whether to include inactive beneficiaries
 
         Returns:
-            Created beneficiary object
+            Number of beneficiaries
         """
-        beneficiary = Beneficiary(**beneficiary_data)
-        self.db.add(beneficiary)
-        self.db.commit()
-        self.db.refresh(beneficiary)
-        return beneficiary
+        query = self.db.query(func.count(Beneficiary.id)).filter(
+            Beneficiary.company_id == company_id
+        )
+        if not include_inactive:
+            query = query.filter(Beneficiary.is_active)
+        return query.scalar()
 
-    def update(
-        self, beneficiary_id: int, beneficiary_data: dict
-    ) -> Optional[Beneficiary]:
+    def list_summaries(
+        self, company_id: int, include_inactive: bool = False
+    ) -> List[Row]:
         """
-        Update a beneficiary.
+        Get a company's beneficiaries as lightweight rows for list views.
+
+        Only the _SUMMARY_COLUMNS are selected; bank accounts are not
+        loaded and the rows are plain tuples that the session does not track.
 
         Args:
-            beneficiary_id: Beneficiary ID
-            beneficiary_data: Dictionary containing updated beneficiary data
+            company_id: Company ID
+            include_inactive: Whether to include inactive beneficiaries
 
         Returns:
-            Updated beneficiary object if found, None otherwise
+            List of rows ordered by name
         """
-        beneficiary = self.get_by_id(beneficiary_id)
-        if not beneficiary:
-            return None
+        stmt = select(*self._SUMMARY_COLUMNS).where(
+            Beneficiary.company_id == company_id
+        )
+        if not include_inactive:
+            stmt = stmt.where(Beneficiary.is_active)
+        return self.db.execute(
+            stmt.order_by(Beneficiary.beneficiary_name, Beneficiary.id)
+        ).all()
+
+    def _company_query(self, company_id: int, include_inactive: bool) -> Query:
+        query = self._with_accounts(self.db.query(Beneficiary)).filter(
+            Beneficiary.company_id == company_id
+        )
 
-        for key, value in beneficiary_data.items():
-            if hasattr(beneficiary, key):
-                setattr(beneficiary, key, value)
+        if not include_inactive:
+            query = query.filter(Beneficiary.is_active)
 
-        self.db.commit()
-        self.db.refresh(beneficiary)
-        return beneficiary
+        return query
 
     def delete(self, beneficiary_id: int) -> bool:
         """
@@ -104,7 +178,7 @@ class BeneficiaryRepository:
             return False
 
         beneficiary.is_active = False
-        self.db.commit()
+        self.db.flush()
         return True
 
     def restore(self, beneficiary_id: int) -> bool:
@@ -122,7 +196,7 @@ class BeneficiaryRepository:
             return False
 
         beneficiary.is_active = True
-        self.db.commit()
+        self.db.flush()
         return True
 
     def search(self, company_id: int, search_term: str) -> List[Beneficiary]:
@@ -134,44 +208,35 @@ class BeneficiaryRepository:
             search_term: Search term
 
         Returns:
-            List of matching beneficiaries
+            List of matching beneficiaries, ordered by name
         """
         search_pattern = f"%{search_term}%"
         return (
-            self.db.query(Beneficiary)
+            self._with_accounts(self.db.query(Beneficiary))
             .filter(
                 Beneficiary.company_id == company_id,
-                Beneficiary.is_active == True,
+                Beneficiary.is_active,
                 or_(
                     Beneficiary.beneficiary_name.ilike(search_pattern),
                     Beneficiary.country.ilike(search_pattern),
                 ),
             )
+            .order_by(Beneficiary.beneficiary_name, Beneficiary.id)
             .all()
         )
 
+    @staticmethod
+    def _with_accounts(query: Query) -> Query:
+        """Eager-load bank accounts for a beneficiary query."""
+        return query.options(selectinload(Beneficiary.bank_accounts))
 
-class BeneficiaryBankAccountRepository:
-    """Repository for beneficiary bank account database operations."""
 
-    def __init__(self, db: Session):
-        self.db = db
+class BeneficiaryBankAccountRepository(BaseRepository[BeneficiaryBankAccount]):
+    """Repository for beneficiary bank account database operations."""
 
-    def get_by_id(self, account_id: int) -> Optional[BeneficiaryBankAccount]:
-        """
-        Get bank account by ID.
+    __slots__ = ()
 
-        Args:
-            account_id: Bank account ID
-
-        Returns:
-            Bank account object if found, None otherwise
-        """
-        return (
-            self.db.query(BeneficiaryBankAccount)
-            .filter(BeneficiaryBankAccount.id == account_id)
-            .first()
-        )
+    model = BeneficiaryBankAccount
 
     def get_by_beneficiary(self, beneficiary_id: int) -> List[BeneficiaryBankAccount]:
         """
@@ -203,11 +268,7 @@ class BeneficiaryBankAccountRepository:
         if account_data.get("is_default", False):
             self._unset_default_accounts(account_data["beneficiary_id"])
 
-        account = BeneficiaryBankAccount(**account_data)
-        self.db.add(account)
-        self.db.commit()
-        self.db.refresh(account)
-        return account
+        return super().create(account_data)
 
     def update(
         self, account_id: int, account_data: dict
@@ -222,40 +283,14 @@ class BeneficiaryBankAccountRepository:
         Returns:
             Updated bank account object if found, None otherwise
         """
-        account = self.get_by_id(account_id)
-        if not account:
-            return None
+        account = super().update(account_id, account_data)
 
-        # If setting as default, unset other defaults
-        if account_data.get("is_default", False):
-            self._unset_default_accounts(account.beneficiary_id)
-
-        for key, value in account_data.items():
-            if hasattr(account, key):
-                setattr(account, key, value)
+        # If setting as default, unset other defaults in the same transaction
+        if account and account_data.get("is_default", False):
+            self._unset_default_accounts(account.beneficiary_id, account.id)
 
-        self.db.commit()
-        self.db.refresh(account)
         return account
 
-    def delete(self, account_id: int) -> bool:
-        """
-        Delete a bank account.
-
-        Args:
-            account_id: Bank account ID
-
-        Returns:
-            True if deleted, False if not found
-        """
-        account = self.get_by_id(account_id)
-        if not account:
-            return False
-
-        self.db.delete(account)
-        self.db.commit()
-        return True
-
     def set_default(self, account_id: int) -> Optional[BeneficiaryBankAccount]:
         """
         Set a bank account as default for its beneficiary.
@@ -271,23 +306,31 @@ class BeneficiaryBankAccountRepository:
             return None
 
         # Unset other defaults
-        self._unset_default_accounts(account.beneficiary_id)
+        self._unset_default_accounts(account.beneficiary_id, account.id)
 
         # Set this as default
         account.is_default = True
-        self.db.commit()
-        self.db.refresh(account)
+        self.db.flush()
         return account
 
-    def _unset_default_accounts(self, beneficiary_id: int) -> None:
+    def _unset_default_accounts(
+        self, beneficiary_id: int, keep_account_id: Optional[int] = None
+    ) -> None:
         """
         Unset all default accounts for a beneficiary.
 
+        Runs inside the caller's transaction. The UPDATE returns the IDs it
+        touched so accounts already loaded in the session are updated too;
+        the session does not expire them on commit.
+
         Args:
             beneficiary_id: Beneficiary ID
+            keep_account_id: Optional account ID to leave untouched
         """
-        self.db.query(BeneficiaryBankAccount).filter(
+        query = self.db.query(BeneficiaryBankAccount).filter(
             BeneficiaryBankAccount.beneficiary_id == beneficiary_id,
-            BeneficiaryBankAccount.is_default == True,
-        ).update({"is_default": False})
-        self.db.commit()
+            BeneficiaryBankAccount.is_default,
+        )
+        if keep_account_id is not None:
+            query = query.filter(BeneficiaryBankAccount.id != keep_account_id)
+        query.update({"is_default": False}, synchronize_session="fetch")
@@ -2,28 +2,18 @@
 Company repository for database operations.
 """
 
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from app.database.models import Company
+from typing import List, Optional, Tuple
+from sqlalchemy import func, select
+from app.database.models import Beneficiary, Company, User
+from app.repositories.base import BaseRepository
 
 
-class CompanyRepository:
+class CompanyRepository(BaseRepository[Company]):
     """Repository for company database operations."""
 
-    def __init__(self, db: Session):
-        self.db = db
+    __slots__ = ()
 
-    def get_by_id(self, company_id: int) -> Optional[Company]:
-        """
-        Get company by ID.
-
-        Args:
-            company_id: Company ID
-
-        Returns:
-            Company object if found, None otherwise
-        """
-        return self.db.query(Company).filter(Company.id == company_id).first()
+    model = Company
 
     def get_all(self) -> List[Company]:
         """
@@ -34,62 +24,35 @@ class CompanyRepository:
         """
         return self.db.query(Company).all()
 
-    def create(self, company_data: dict) -> Company:
-        """
-        Create a new company.
-
-        Args:
-            company_data: Dictionary containing company data
-
-        Returns:
-            Created company object
-        """
-        company = Company(**company_data)
-        self.db.add(company)
-        self.db.commit()
-        self.db.refresh(company)
-        return company
-
-    def update(self, company_id: int, company_data: dict) -> Optional[Company]:
-        """
-        Update a company.
-
-        Args:
-            company_id: Company ID
-            company_data: Dictionary containing updated company data
-
-        Returns:
-            Updated company object if found, None otherwise
+    def get_summary(self, company_id: int) -> Optional[Tuple[Company, int, int]]:
         """
-        company = self.get_by_id(company_id)
-        if not company:
-            return None
+        Get a company with its user and beneficiary counts.
 
-        for key, value in company_data.items():
-            if hasattr(company, key):
-                setattr(company, key, value)
-
-        self.db.commit()
-        self.db.refresh(company)
-        return company
-
-    def delete(self, company_id: int) -> bool:
-        """
-        Delete a company.
+        The counts are correlated COUNT subqueries, so no user or
+        beneficiary rows are loaded.
 
         Args:
             company_id: Company ID
 
         Returns:
-            True if deleted, False if not found
+            Tuple of (company, user_count, beneficiary_count) if found,
+            None otherwise
         """
-        company = self.get_by_id(company_id)
-        if not company:
-            return False
-
-        self.db.delete(company)
-        self.db.commit()
-        return True
+        user_count = (
+            select(func.count(User.id))
+            .where(User.company_id == Company.id)
+            .scalar_subquery()
+        )
+        beneficiary_count = (
+            select(func.count(Beneficiary.id))
+            .where(Beneficiary.company_id == Company.id)
+            .scalar_subquery()
+        )
+        return self.db.execute(
+            select(Company, user_count, beneficiary_count).where(
+                Company.id == company_id
+            )
+        ).one_or_none()
 
     def search_by_name(self, name: str) -> List[Company]:
         """
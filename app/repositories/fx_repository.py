@@ -2,30 +2,34 @@
 FX Quote repository for database operations.
 """
 
-from typing import Optional, List
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from typing import Iterator, Optional, List
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query
+from sqlalchemy import case, func, lambda_stmt, select, update
+from app.database.expressions import days_ago, utc_now
 from app.database.models import FXQuote
+from app.repositories.base import BaseRepository
 
 
-class FXQuoteRepository:
+class FXQuoteRepository(BaseRepository[FXQuote]):
     """Repository for FX quote database operations."""
 
-    def __init__(self, db: Session):
-        self.db = db
+    __slots__ = ()
 
-    def get_by_id(self, quote_id: int) -> Optional[FXQuote]:
-        """
-        Get FX quote by ID.
+    model = FXQuote
 
-        Args:
-            quote_id: Quote ID
-
-        Returns:
-            FXQuote object if found, None otherwise
-        """
-        return self.db.query(FXQuote).filter(FXQuote.id == quote_id).first()
+    # Columns returned by get_recent_quote_summaries()
+    _SUMMARY_COLUMNS = (
+        FXQuote.id,
+        FXQuote.quote_id,
+        FXQuote.source_currency,
+        FXQuote.target_currency,
+        FXQuote.final_rate,
+        FXQuote.markup_percentage,
+        FXQuote.is_expired,
+        FXQuote.quote_expires_at,
+        FXQuote.created_at,
+    )
 
     def get_by_quote_id(self, quote_id: str) -> Optional[FXQuote]:
         """
@@ -37,7 +41,8 @@ class FXQuoteRepository:
         Returns:
             FXQuote object if found, None otherwise
         """
-        return self.db.query(FXQuote).filter(FXQuote.quote_id == quote_id).first()
+        stmt = lambda_stmt(lambda: select(FXQuote).where(FXQuote.quote_id == quote_id))
+        return self.db.execute(stmt).scalar_one_or_none()
 
     def get_by_company(
         self, company_id: int, include_expired: bool = False
@@ -52,59 +57,89 @@ class FXQuoteRepository:
         Returns:
             List of FX quotes
         """
-        query = self.db.query(FXQuote).filter(FXQuote.company_id == company_id)
+        return self._company_query(company_id, include_expired).all()
+
+    def get_company_page(
+        self,
+        company_id: int,
+        page: int = 0,
+        page_size: int = 50,
+        include_expired: bool = False,
+    ) -> List[FXQuote]:
+        """
+        Get one page of FX quotes for a company, newest first.
 
-        if not include_expired:
-            query = query.filter(
-                or_(
-                    FXQuote.is_expired == False,
-                    and_(
-                        FXQuote.is_expired == False,
-                        FXQuote.quote_expires_at > datetime.utcnow(),
-                    ),
-                )
-            )
+        Args:
+            company_id: Company ID
+            page: Zero-based page number
+            page_size: Number of quotes per page
+            include_expired: Whether to include expired quotes
 
-        return query.order_by(FXQuote.created_at.desc()).all()
+        Returns:
+            List of FX quotes on the page
+        """
+        return (
+            self._company_query(company_id, include_expired)
+            .offset(page * page_size)
+            .limit(page_size)
+            .all()
+        )
 
-    def create(self, quote_data: dict) -> FXQuote:
+    def stream_by_company(
+        self,
+        company_id: int,
+        include_expired: bool = True,
+        batch_size: int = 1000,
+    ) -> Iterator[FXQuote]:
         """
-        Create a new FX quote.
+        Stream FX quotes for a company for exports and reports.
+
+        Quotes are fetched in batches from a server-side cursor instead of
+        being materialized as one list.
 
         Args:
-            quote_data: Dictionary containing quote data
+            company_id: Company ID
+            include_expired: Whether to include expired quotes
+            batch_size: Number of rows fetched per round trip
 
-        Returns:
-            Created FXQuote object
+        Yields:
+            FXQuote objects, newest first
         """
-        quote = FXQuote(**quote_data)
-        self.db.add(quote)
-        self.db.commit()
-        self.db.refresh(quote)
-        return quote
+        yield from self._company_query(company_id, include_expired).yield_per(
+            batch_size
+        )
 
-    def update(self, quote_id: int, quote_data: dict) -> Optional[FXQuote]:
+    def count_by_company(self, company_id: int, include_expired: bool = False) -> int:
         """
-        Update an FX quote.
+        Count FX quotes for a company without loading them.
 
         Args:
-            quote_id: Quote ID
-            quote_data: Dictionary containing updated quote data
+            company_id: Company ID
+            include_expired: Whether to include expired quotes
 
         Returns:
-            Updated FXQuote object if found, None otherwise
+            Number of quotes
         """
-        quote = self.get_by_id(quote_id)
-        if not quote:
-            return None
+        query = self.db.query(func.count(FXQuote.id)).filter(
+            FXQuote.company_id == company_id
+        )
+        if not include_expired:
+            query = query.filter(
+                ~FXQuote.is_expired, FXQuote.quote_expires_at > utc_now()
+            )
+        return query.scalar()
 
-        for key, value in quote_data.items():
-            if hasattr(quote, key):
-                setattr(quote, key, value)
+    def _company_query(self, company_id: int, include_expired: bool) -> Query:
+        query = self.db.query(FXQuote).filter(FXQuote.company_id == company_id)
+
+        if not include_expired:
+            # Also drop quotes past expiry that have not been marked yet
+            query = query.filter(
+                ~FXQuote.is_expired,
+                FXQuote.quote_expires_at > utc_now(),
+            )
 
-        self.db.commit()
-        self.db.refresh(quote)
-        return quote
+        return query.order_by(FXQuote.created_at.desc())
 
     def mark_expired(self, quote_id: int) -> bool:
         """
@@ -121,7 +156,7 @@ class FXQuoteRepository:
             return False
 
         quote.is_expired = True
-        self.db.commit()
+        self.db.flush()
         return True
 
     def get_active_quotes(
@@ -137,38 +172,52 @@ class FXQuoteRepository:
         Returns:
             List of active FX quotes
         """
-        query = self.db.query(FXQuote).filter(
-            FXQuote.company_id == company_id,
-            FXQuote.is_expired == False,
-            FXQuote.quote_expires_at > datetime.utcnow(),
+        stmt = lambda_stmt(
+            lambda: select(FXQuote)
+            .where(
+                FXQuote.company_id == company_id,
+                ~FXQuote.is_expired,
+                FXQuote.quote_expires_at > utc_now(),
+            )
+            .order_by(FXQuote.created_at.desc())
         )
 
         if currency_pair:
             source_currency, target_currency = currency_pair
-            query = query.filter(
+            stmt += lambda s: s.where(
                 FXQuote.source_currency == source_currency,
                 FXQuote.target_currency == target_currency,
             )
 
-        return query.order_by(FXQuote.created_at.desc()).all()
+        return self.db.execute(stmt).scalars().all()
 
-    def expire_old_quotes(self) -> int:
+    def expire_quote_batch(self, batch_size: int = 5000) -> int:
         """
-        Mark all expired quotes in database.
+        Mark up to batch_size past-expiry quotes as expired.
+
+        Rows locked by another transaction are skipped, so concurrent
+        runs never wait on each other and each batch holds its row locks
+        only briefly.
+
+        Args:
+            batch_size: Maximum number of quotes to update
 
         Returns:
             Number of quotes marked as expired
         """
-        result = (
-            self.db.query(FXQuote)
-            .filter(
-                FXQuote.is_expired == False,
-                FXQuote.quote_expires_at < datetime.utcnow(),
-            )
-            .update({"is_expired": True})
+        batch = (
+            select(FXQuote.id)
+            .where(~FXQuote.is_expired, FXQuote.quote_expires_at < utc_now())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = self.db.execute(
+            update(FXQuote)
+            .where(FXQuote.id.in_(batch.scalar_subquery()))
+            .values(is_expired=True)
+            .execution_options(synchronize_session=False)
         )
-        self.db.commit()
-        return result
+        return result.rowcount
 
     def get_recent_quotes(
         self, company_id: int, days: int = 7, limit: int = 50
@@ -184,7 +233,7 @@ class FXQuoteRepository:
         Returns:
             List of recent FX quotes
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        cutoff_date = days_ago(days)
         return (
             self.db.query(FXQuote)
             .filter(FXQuote.company_id == company_id, FXQuote.created_at >= cutoff_date)
@@ -193,6 +242,32 @@ class FXQuoteRepository:
             .all()
         )
 
+    def get_recent_quote_summaries(
+        self, company_id: int, days: int = 7, limit: int = 50
+    ) -> List[Row]:
+        """
+        Get recent quotes for a company as lightweight rows for list views.
+
+        Only the columns a quote history table shows are selected, and the
+        rows are plain tuples that the session does not track.
+
+        Args:
+            company_id: Company ID
+            days: Number of days to look back
+            limit: Maximum number of quotes to return
+
+        Returns:
+            List of rows with the _SUMMARY_COLUMNS attributes, newest first
+        """
+        return self.db.execute(
+            select(*self._SUMMARY_COLUMNS)
+            .where(
+                FXQuote.company_id == company_id, FXQuote.created_at >= days_ago(days)
+            )
+            .order_by(FXQuote.created_at.desc())
+            .limit(limit)
+        ).all()
+
     def get_quote_statistics(self, company_id: int, days: int = 30) -> dict:
         """
         Get quote statistics for a company.
@@ -204,28 +279,33 @@ class FXQuoteRepository:
         Returns:
             Dictionary with statistics
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-        quotes = (
-            self.db.query(FXQuote)
-            .filter(FXQuote.company_id == company_id, FXQuote.created_at >= cutoff_date)
-            .all()
-        )
+        cutoff_date = days_ago(days)
+        window = (FXQuote.company_id == company_id, FXQuote.created_at >= cutoff_date)
 
-        if not quotes:
-            return {
-                "total_quotes": 0,
-                "expired_quotes": 0,
-                "active_quotes": 0,
-                "currency_pairs": [],
-            }
+        total_quotes, expired_quotes = (
+            self.db.query(
+                func.count(FXQuote.id),
+                func.coalesce(func.sum(case((FXQuote.is_expired, 1), else_=0)), 0),
+            )
+            .filter(*window)
+            .one()
+        )
 
-        currency_pairs = set()
-        for quote in quotes:
-            currency_pairs.add(f"{quote.source_currency}/{quote.target_currency}")
+        # Skip the second round trip when the window is empty
+        currency_pairs = []
+        if total_quotes:
+            currency_pairs = [
+                f"{source_currency}/{target_currency}"
+                for source_currency, target_currency in (
+                    self.db.query(FXQuote.source_currency, FXQuote.target_currency)
+                    .filter(*window)
+                    .distinct()
+                )
+            ]
 
         return {
-            "total_quotes": len(quotes),
-            "expired_quotes": sum(1 for q in quotes if q.is_expired),
-            "active_quotes": sum(1 for q in quotes if not q.is_expired),
-            "currency_pairs": list(currency_pairs),
+            "total_quotes": total_quotes,
+            "expired_quotes": expired_quotes,
+            "active_quotes": total_quotes - expired_quotes,
+            "currency_pairs": currency_pairs,
         }
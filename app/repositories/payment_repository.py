@@ -0,0 +1,58 @@
+"""
+Payment repository for database operations.
+"""
+
+from typing import Iterator, Optional
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.orm import Session
+from sqlalchemy import desc, select
+from app.database.models import Payment
+
+
+class PaymentRepository:
+    """Repository for payment database operations."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def stream_by_company(
+        self,
+        company_id: int,
+        status: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[RowMapping]:
+        """
+        Stream payment list rows for a company.
+
+        Rows are fetched in batches from a server-side cursor as plain
+        mappings of the listing columns, without ORM hydration.
+
+        Args:
+            company_id: Company ID
+            status: Optional payment status filter
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Row mappings with the payment listing columns
+        """
+        stmt = select(
+            Payment.id,
+            Payment.beneficiary_id,
+            Payment.source_currency,
+            Payment.target_currency,
+            Payment.source_amount,
+            Payment.target_amount,
+            Payment.fx_rate,
+            Payment.total_debit,
+            Payment.status,
+            Payment.created_by_user_id,
+            Payment.created_at,
+        ).where(Payment.company_id == company_id)
+
+        if status:
+            stmt = stmt.where(Payment.status == status)
+
+        stmt = stmt.order_by(desc(Payment.created_at)).execution_options(
+            yield_per=batch_size
+        )
+        yield from self.db.execute(stmt).mappings()
@@ -2,28 +2,18 @@
 User repository for database operations.
 """
 
-from typing import Optional, List
-from sqlalchemy.orm import Session
+from typing import Iterator, Optional, List
+from sqlalchemy import func, lambda_stmt, select
 from app.database.models import User
+from app.repositories.base import BaseRepository
 
 
-class UserRepository:
+class UserRepository(BaseRepository[User]):
     """Repository for user database operations."""
 
-    def __init__(self, db: Session):
-        self.db = db
+    __slots__ = ()
 
-    def get_by_id(self, user_id: int) -> Optional[User]:
-        """
-        Get user by ID.
-
-        Args:
-            user_id: User ID
-
-        Returns:
-            User object if found, None otherwise
-        """
-        return self.db.query(User).filter(User.id == user_id).first()
+    model = User
 
     def get_by_email(self, email: str) -> Optional[User]:
         """
@@ -35,7 +25,8 @@ class UserRepository:
         Returns:
             User object if found, None otherwise
         """
-        return self.db.query(User).filter(User.email == email).first()
+        stmt = lambda_stmt(lambda: select(User).where(User.email == email))
+        return self.db.execute(stmt).scalar_one_or_none()
 
     def get_all(self) -> List[User]:
         """
@@ -46,56 +37,47 @@ class UserRepository:
         """
         return self.db.query(User).all()
 
-    def get_by_company(self, company_id: int) -> List[User]:
+    def stream_all(self, batch_size: int = 1000) -> Iterator[User]:
         """
-        Get all users for a company.
+        Stream all users for exports and reports.
+
+        Users are fetched in batches from a server-side cursor instead of
+        being materialized as one list.
 
         Args:
-            company_id: Company ID
+            batch_size: Number of rows fetched per round trip
 
-        Returns:
-            List of users
+        Yields:
+            User objects
         """
-        return self.db.query(User).filter(User.company_id == company_id).all()
+        yield from self.db.query(User).order_by(User.id).yield_per(batch_size)
 
-    def create(self, user_data: dict) -> User:
+    def count(self, company_id: Optional[int] = None) -> int:
         """
-        Create a new user.
+        Count users without loading them.
 
         Args:
-            user_data: Dictionary containing user data
+            company_id: Optional company ID to filter by
 
         Returns:
-            Created user object
+            Number of users
         """
-        user = User(**user_data)
-        self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
-        return user
+        query = self.db.query(func.count(User.id))
+        if company_id:
+            query = query.filter(User.company_id == company_id)
+        return query.scalar()
 
-    def update(self, user_id: int, user_data: dict) -> Optional[User]:
+    def get_by_company(self, company_id: int) -> List[User]:
         """
-        Update a user.
+        Get all users for a company.
 
         Args:
-            user_id: User ID
-            user_data: Dictionary containing updated user data
+            company_id: Company ID
 
         Returns:
-            Updated user object if found, None otherwise
+            List of users
         """
-        user = self.get_by_id(user_id)
-        if not user:
-            return None
-
-        for key, value in user_data.items():
-            if hasattr(user, key):
-                setattr(user, key, value)
-
-        self.db.commit()
-        self.db.refresh(user)
-        return user
+        return self.db.query(User).filter(User.company_id == company_id).all()
 
     def delete(self, user_id: int) -> bool:
         """
@@ -112,7 +94,7 @@ class UserRepository:
             return False
 
         user.is_active = False
-        self.db.commit()
+        self.db.flush()
         return True
 
     def get_active_users(self, company_id: Optional[int] = None) -> List[User]:
@@ -125,7 +107,7 @@ class UserRepository:
         Returns:
             List of active users
         """
-        query = self.db.query(User).filter(User.is_active == True)
+        query = self.db.query(User).filter(User.is_active)
         if company_id:
             query = query.filter(User.company_id == company_id)
         return query.all()
@@ -2,18 +2,152 @@
 Audit logging service.
 """
 
-from typing import Optional, Dict, List, Any
-from datetime import datetime
+import atexit
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional
 from sqlalchemy.orm import Session
-from app.repositories.audit_repository import AuditRepository
+from app.database.connection import get_sessionmaker
+from app.database.models import AuditLog
+from app.repositories.audit_repository import AuditEntry, AuditRepository
+
+logger = logging.getLogger(__name__)
+
+
+class AuditWriter:
+    """
+    Background writer that persists queued audit entries in batches.
+
+    A single daemon thread drains the queue, collecting up to batch_size
+    entries (or whatever arrives within flush_interval seconds) and writes
+    them with one bulk insert on its own session. Callers only pay for a
+    queue put.
+
+    Delivery is best effort: a batch that fails to insert is logged and
+    dropped, and entries still queued when the process is killed are lost.
+    Only use it for high-volume, low-value events; anything that must be
+    on the trail goes through AuditService.log_action().
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._session_factory = session_factory
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, entries: List[AuditEntry]) -> None:
+        """
+        Queue audit entries for writing.
+
+        Args:
+            entries: Audit entries
+        """
+        self._ensure_started()
+        for entry in entries:
+            self._queue.put_nowait(entry)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Write any queued entries and stop the worker thread."""
+        if self._thread is None:
+            return
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="audit-writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.stop)
+
+    def _run(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is self._STOP:
+                return
+
+            batch = [entry]
+            stopping = False
+            while len(batch) < self.batch_size:
+                try:
+                    entry = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    break
+                if entry is self._STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            self._write(batch)
+            if stopping:
+                return
+
+    def _write(self, batch: List[AuditEntry]) -> None:
+        db = (self._session_factory or get_sessionmaker())()
+        try:
+            AuditRepository(db).create_many(batch)
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("Failed to write %d audit entries", len(batch))
+        finally:
+            db.close()
+
+
+# One writer per process, shared by every AuditService
+audit_writer = AuditWriter()
 
 
 class AuditService:
-    """Service for audit logging."""
+    """
+    Service for audit logging.
+
+    log_action() writes the entry and commits it on the caller's session.
+    queue_action() is the opt-in alternative for high-volume, low-value
+    events: entries are buffered in memory and flush() hands them to the
+    background AuditWriter. Use the service as a context manager to flush
+    queued entries on exit:
 
-    def __init__(self, db: Session):
+        with AuditService(db) as audit_service:
+            audit_service.queue_action(...)
+    """
+
+    def __init__(self, db: Session, writer: Optional[AuditWriter] = None):
         self.db = db
         self.audit_repo = AuditRepository(db)
+        self._writer = writer or audit_writer
+        self._buffer: List[AuditEntry] = []
+
+    def __enter__(self) -> "AuditService":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Only persist the trail for work that completed
+        if exc_type is None:
+            self.flush()
+        else:
+            self._buffer.clear()
+
+    def flush(self) -> None:
+        """Queue all buffered audit entries for the background writer."""
+        if not self._buffer:
+            return
+        self._writer.submit(self._buffer)
+        self._buffer = []
 
     def log_action(
         self,
@@ -24,10 +158,12 @@ class AuditService:
         old_values: Optional[Dict[str, Any]] = None,
         new_values: Optional[Dict[str, Any]] = None,
         ip_address: Optional[str] = None,
-    ) -> None:
+    ) -> AuditLog:
         """
         Log an action to the audit trail.
 
+        The entry is written and committed on the service's session.
+
         Args:
             user_id: ID of user performing the action (None for system actions)
             entity_type: Type of entity being modified
@@ -36,18 +172,60 @@ class AuditService:
             old_values: Previous values (for updates)
             new_values: New values (for creates/updates)
             ip_address: IP address of the request
+
+        Returns:
+            Created audit log object
+        """
+        audit_entry = AuditEntry(
+            user_id,
+            entity_type,
+            entity_id,
+            action,
+            old_values=old_values,
+            new_values=new_values,
+            ip_address=ip_address,
+        )
+
+        audit_log = self.audit_repo.create(audit_entry)
+        self.db.commit()
+        return audit_log
+
+    def queue_action(
+        self,
+        user_id: Optional[int],
+        entity_type: str,
+        entity_id: int,
+        action: str,
+        old_values: Optional[Dict[str, Any]] = None,
+        new_values: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+    ) -> None:
         """
-        audit_data = {
-            "user_id": user_id,
-            "entity_type": entity_type,
-            "entity_id": entity_id,
-            "action": action,
-            "old_values": old_values,
-            "new_values": new_values,
-            "ip_address": ip_address,
-        }
+        Queue an action for the background audit writer.
 
-        self.audit_repo.create(audit_data)
+        The entry is buffered until flush() is called and then written
+        on a best-effort basis; see AuditWriter.
+
+        Args:
+            user_id: ID of user performing the action (None for system actions)
+            entity_type: Type of entity being modified
+            entity_id: ID of the entity
+            action: Action being performed
+            old_values: Previous values (for updates)
+            new_values: New values (for creates/updates)
+            ip_address: IP address of the request
+        """
+        self._buffer.append(
+            AuditEntry(
+                user_id,
+                entity_type,
+                entity_id,
+                action,
+                old_values=old_values,
+                new_values=new_values,
+                ip_address=ip_address,
+            )
+        )
 
     def log_login(self, user_id: int, ip_address: Optional[str] = None) -> None:
         """
@@ -97,6 +275,29 @@ class AuditService:
         """
         return self.audit_repo.get_by_entity(entity_type, entity_id, limit)
 
+    def get_entities_history(
+        self, entity_type: str, entity_ids: List[int], per_entity_limit: int = 1
+    ) -> Dict[int, List]:
+        """
+        Get the latest audit history for several entities at once.
+
+        Use this instead of calling get_entity_history() in a loop.
+
+        Args:
+            entity_type: Type of entity
+            entity_ids: IDs of entities
+            per_entity_limit: Maximum records to return per entity
+
+        Returns:
+            Dictionary mapping entity ID to its audit log entries, newest first
+        """
+        history = {entity_id: [] for entity_id in entity_ids}
+        for entry in self.audit_repo.get_by_entities(
+            entity_type, entity_ids, per_entity_limit
+        ):
+            history[entry.entity_id].append(entry)
+        return history
+
     def get_user_activity(self, user_id: int, limit: int = 100) -> List:
         """
         Get activity history for a user.
@@ -2,17 +2,62 @@
 Authentication service for user management.
 """
 
-from typing import Optional
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import Dict, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.database.models import User
-from app.utils.security import verify_password, hash_password
+from app.utils.security import hash_password, needs_rehash, verify_password
+
+# Lookups cached per service instance, keyed by ("id", id) / ("email", email)
+UserCache = Dict[Tuple[str, object], Optional[User]]
+
+
+# Password hashing is CPU-bound; async callers run it here instead of on
+# the event loop. Argon2 releases the GIL, so the workers run in parallel.
+_kdf_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="kdf")
+
+
+async def _run_kdf(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(_kdf_pool, func, *args)
+
+
+@cache
+def _dummy_hash() -> str:
+    # Built on first use: hashing at import would add an Argon2 run to
+    # every process start
+    return hash_password("x" * 16)
+
+
+def _verify_dummy(password: str) -> None:
+    # Verified against when the user is missing or inactive, so a failed
+    # login pays the same hashing cost as a wrong password. Users still on
+    # legacy bcrypt hashes are timed against bcrypt instead, which remains
+    # distinguishable until they have all logged in and been rehashed.
+    verify_password(password, _dummy_hash())
+
+
+def _cache_user(cache: UserCache, user: User) -> None:
+    cache[("id", user.id)] = user
+    cache[("email", user.email)] = user
 
 
 class AuthService:
-    """Service for user authentication."""
+    """
+    Service for user authentication.
+
+    A service instance lives for one request (one Streamlit run), so user
+    lookups are cached on it; repeated sidebar, permission and audit
+    lookups then cost one query.
+    """
 
     def __init__(self, db: Session):
         self.db = db
+        self._user_cache: UserCache = {}
 
     def authenticate(self, email: str, password: str) -> Optional[User]:
         """
@@ -25,17 +70,20 @@ class AuthService:
         Returns:
             User object if authentication successful, None otherwise
         """
-        user = self.db.query(User).filter(User.email == email).first()
+        user = self.get_user_by_email(email)
 
-        if not user:
-            return None
-
-        if not user.is_active:
+        if not user or not user.is_active:
+            _verify_dummy(password)
             return None
 
         if not verify_password(password, user.password_hash):
             return None
 
+        # Upgrade bcrypt and outdated Argon2 hashes while the password is known
+        if needs_rehash(user.password_hash):
+            user.password_hash = hash_password(password)
+            self.db.commit()
+
         return user
 
     def get_user_by_id(self, user_id: int) -> Optional[User]:
@@ -48,7 +96,13 @@ class AuthService:
         Returns:
             User object if found, None otherwise
         """
-        return self.db.query(User).filter(User.id == user_id).first()
+        key = ("id", user_id)
+        if key not in self._user_cache:
+            user = self.db.query(User).filter(User.id == user_id).first()
+            self._user_cache[key] = user
+            if user:
+                _cache_user(self._user_cache, user)
+        return self._user_cache[key]
 
     def get_user_by_email(self, email: str) -> Optional[User]:
         """
@@ -60,7 +114,13 @@ class AuthService:
         Returns:
             User object if found, None otherwise
         """
-        return self.db.query(User).filter(User.email == email).first()
+        key = ("email", email)
+        if key not in self._user_cache:
+            user = self.db.query(User).filter(User.email == email).first()
+            self._user_cache[key] = user
+            if user:
+                _cache_user(self._user_cache, user)
+        return self._user_cache[key]
 
     def create_user(
         self,
@@ -96,6 +156,123 @@ class AuthService:
 
         self.db.add(user)
         self.db.commit()
-        self.db.refresh(user)
+        _cache_user(self._user_cache, user)
+
+        return user
+
+
+class AsyncAuthService:
+    """
+    Service for user authentication on an asyncio session.
+
+    Mirrors AuthService for async callers, so user lookups do not block
+    the event loop while waiting on the database, and password hashing
+    runs on a worker thread.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._user_cache: UserCache = {}
+
+    async def authenticate(self, email: str, password: str) -> Optional[User]:
+        """
+        Authenticate user with email and password.
+
+        Args:
+            email: User email
+            password: Plain text password
+
+        Returns:
+            User object if authentication successful, None otherwise
+        """
+        user = await self.get_user_by_email(email)
+
+        if not user or not user.is_active:
+            await _run_kdf(_verify_dummy, password)
+            return None
+
+        if not await _run_kdf(verify_password, password, user.password_hash):
+            return None
+
+        # Upgrade bcrypt and outdated Argon2 hashes while the password is known
+        if needs_rehash(user.password_hash):
+            user.password_hash = await _run_kdf(hash_password, password)
+            await self.db.commit()
+
+        return user
+
+    async def get_user_by_id(self, user_id: int) -> Optional[User]:
+        """
+        Get user by ID.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            User object if found, None otherwise
+        """
+        key = ("id", user_id)
+        if key not in self._user_cache:
+            result = await self.db.execute(select(User).where(User.id == user_id))
+            user = result.scalar_one_or_none()
+            self._user_cache[key] = user
+            if user:
+                _cache_user(self._user_cache, user)
+        return self._user_cache[key]
+
+    async def get_user_by_email(self, email: str) -> Optional[User]:
+        """
+        Get user by email.
+
+        Args:
+            email: User email
+
+        Returns:
+            User object if found, None otherwise
+        """
+        key = ("email", email)
+        if key not in self._user_cache:
+            result = await self.db.execute(select(User).where(User.email == email))
+            user = result.scalar_one_or_none()
+            self._user_cache[key] = user
+            if user:
+                _cache_user(self._user_cache, user)
+        return self._user_cache[key]
+
+    async def create_user(
+        self,
+        email: str,
+        password: str,
+        full_name: str,
+        role: str,
+        company_id: int,
+    ) -> User:
+        """
+        Create a new user.
+
+        Args:
+            email: User email
+            password: Plain text password
+            full_name: User's full name
+            role: User role (admin, maker, approver)
+            company_id: Company ID
+
+        Returns:
+            Created User object
+        """
+        password_hash = await _run_kdf(hash_password, password)
+
+        user = User(
+            email=email,
+            password_hash=password_hash,
+            full_name=full_name,
+            role=role,
+            company_id=company_id,
+            is_active=True,
+        )
+
+        self.db.add(user)
+        await self.db.commit()
+        _cache_user(self._user_cache, user)
 
         return user
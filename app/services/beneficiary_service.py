@@ -3,12 +3,14 @@ Beneficiary service for business logic.
 """
 
 from typing import Optional, List, Dict
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
+from app.database.connection import transaction
 from app.repositories.beneficiary_repository import (
     BeneficiaryRepository,
     BeneficiaryBankAccountRepository,
 )
-from app.repositories.audit_repository import AuditRepository
+from app.repositories.audit_repository import AuditEntry, AuditRepository
 from app.database.models import Beneficiary, BeneficiaryBankAccount
 from app.utils.validators import (
     validate_iban,
@@ -18,6 +20,9 @@ from app.utils.validators import (
     format_iban,
 )
 
+# Fields recorded in the audit trail when they change
+_AUDITED_FIELDS = ("beneficiary_name", "beneficiary_type", "country")
+
 
 class BeneficiaryService:
     """Service for beneficiary business logic."""
@@ -55,6 +60,22 @@ class BeneficiaryService:
         """
         return self.beneficiary_repo.get_by_company(company_id, include_inactive)
 
+    def get_company_beneficiary_summaries(
+        self, company_id: int, include_inactive: bool = False
+    ) -> List[Row]:
+        """
+        Get beneficiaries for a company as lightweight rows for list views.
+
+        Args:
+            company_id: Company ID
+            include_inactive: Whether to include inactive beneficiaries
+
+        Returns:
+            List of rows with id, beneficiary_name, beneficiary_type, country
+            and is_active
+        """
+        return self.beneficiary_repo.list_summaries(company_id, include_inactive)
+
     def create_beneficiary(self, beneficiary_data: dict, user_id: int) -> Beneficiary:
         """
         Create a new beneficiary with audit logging.
@@ -66,23 +87,24 @@ class BeneficiaryService:
         Returns:
             Created beneficiary object
         """
-        # Create beneficiary
-        beneficiary = self.beneficiary_repo.create(beneficiary_data)
-
-        # Log the creation
-        self.audit_repo.create(
-            {
-                "user_id": user_id,
-                "entity_type": "beneficiary",
-                "entity_id": beneficiary.id,
-                "action": "created",
-                "new_values": {
-                    "beneficiary_name": beneficiary.beneficiary_name,
-                    "beneficiary_type": beneficiary.beneficiary_type,
-                    "country": beneficiary.country,
-                },
-            }
-        )
+        with transaction(self.db):
+            # Create beneficiary
+            beneficiary = self.beneficiary_repo.create(beneficiary_data)
+
+            # Log the creation
+            self.audit_repo.create(
+                AuditEntry(
+                    user_id,
+                    "beneficiary",
+                    beneficiary.id,
+                    "created",
+                    new_values={
+                        "beneficiary_name": beneficiary.beneficiary_name,
+                        "beneficiary_type": beneficiary.beneficiary_type,
+                        "country": beneficiary.country,
+                    },
+                )
+            )
 
         return beneficiary
 
@@ -100,37 +122,26 @@ class BeneficiaryService:
         Returns:
             Updated beneficiary object if found, None otherwise
         """
-        # Get old values for audit
-        old_beneficiary = self.beneficiary_repo.get_by_id(beneficiary_id)
-        if not old_beneficiary:
-            return None
-
-        old_values = {
-            "beneficiary_name": old_beneficiary.beneficiary_name,
-            "beneficiary_type": old_beneficiary.beneficiary_type,
-            "country": old_beneficiary.country,
-        }
-
-        # Update beneficiary
-        beneficiary = self.beneficiary_repo.update(beneficiary_id, beneficiary_data)
-
-        if beneficiary:
-            # Log the update
-            self.audit_repo.create(
-                {
-                    "user_id": user_id,
-                    "entity_type": "beneficiary",
-                    "entity_id": beneficiary.id,
-                    "action": "updated",
-                    "old_values": old_values,
-                    "new_values": {
-                        "beneficiary_name": beneficiary.beneficiary_name,
-                        "beneficiary_type": beneficiary.beneficiary_type,
-                        "country": beneficiary.country,
-                    },
-                }
+        with transaction(self.db):
+            beneficiary, changes = self.beneficiary_repo.update_with_changes(
+                beneficiary_id, beneficiary_data
             )
 
+            # Log the update with before/after values of the changed fields,
+            # only when one of them is an audited field
+            old_values = {k: changes[k] for k in _AUDITED_FIELDS if k in changes}
+            if old_values:
+                self.audit_repo.create(
+                    AuditEntry(
+                        user_id,
+                        "beneficiary",
+                        beneficiary.id,
+                        "updated",
+                        old_values=old_values,
+                        new_values={k: getattr(beneficiary, k) for k in old_values},
+                    )
+                )
+
         return beneficiary
 
     def disable_beneficiary(self, beneficiary_id: int, user_id: int) -> bool:
@@ -144,18 +155,14 @@ class BeneficiaryService:
         Returns:
             True if disabled, False if not found
         """
-        success = self.beneficiary_repo.delete(beneficiary_id)
+        with transaction(self.db):
+            success = self.beneficiary_repo.delete(beneficiary_id)
 
-        if success:
-            # Log the disable
-            self.audit_repo.create(
-                {
-                    "user_id": user_id,
-                    "entity_type": "beneficiary",
-                    "entity_id": beneficiary_id,
-                    "action": "disabled",
-                }
-            )
+            if success:
+                # Log the disable
+                self.audit_repo.create(
+                    AuditEntry(user_id, "beneficiary", beneficiary_id, "disabled")
+                )
 
         return success
 
@@ -170,18 +177,14 @@ class BeneficiaryService:
         Returns:
             True if enabled, False if not found
         """
-        success = self.beneficiary_repo.restore(beneficiary_id)
+        with transaction(self.db):
+            success = self.beneficiary_repo.restore(beneficiary_id)
 
-        if success:
-            # Log the enable
-            self.audit_repo.create(
-                {
-                    "user_id": user_id,
-                    "entity_type": "beneficiary",
-                    "entity_id": beneficiary_id,
-                    "action": "enabled",
-                }
-            )
+            if success:
+                # Log the enable
+                self.audit_repo.create(
+                    AuditEntry(user_id, "beneficiary", beneficiary_id, "enabled")
+                )
 
         return success
 
@@ -214,18 +217,79 @@ class BeneficiaryService:
         Returns:
             Tuple of (bank_account, error_message)
         """
+        error = self._prepare_account(account_data)
+        if error:
+            return None, error
+
+        # Ensure beneficiary_id is set
+        account_data["beneficiary_id"] = beneficiary_id
+
+        with transaction(self.db):
+            # Create bank account
+            account = self.bank_account_repo.create(account_data)
+
+            # Log the creation
+            self.audit_repo.create(self._account_created_entry(account, user_id))
+
+        return account, None
+
+    def add_bank_accounts(
+        self, beneficiary_id: int, accounts_data: List[dict], user_id: int
+    ) -> tuple[List[BeneficiaryBankAccount], Optional[str]]:
+        """
+        Add several bank accounts to a beneficiary, e.g. from a bulk upload.
+
+        All accounts are validated before any is written. They are then
+        created in one transaction and their audit rows inserted together.
+
+        Args:
+            beneficiary_id: Beneficiary ID
+            accounts_data: List of dictionaries containing bank account data
+            user_id: ID of user adding the accounts
+
+        Returns:
+            Tuple of (bank_accounts, error_message)
+        """
+        for index, account_data in enumerate(accounts_data, start=1):
+            error = self._prepare_account(account_data)
+            if error:
+                return [], f"Account {index}: {error}"
+            account_data["beneficiary_id"] = beneficiary_id
+
+        with transaction(self.db):
+            accounts = [
+                self.bank_account_repo.create(account_data)
+                for account_data in accounts_data
+            ]
+            self.audit_repo.create_many(
+                [self._account_created_entry(account, user_id) for account in accounts]
+            )
+
+        return accounts, None
+
+    @staticmethod
+    def _prepare_account(account_data: dict) -> Optional[str]:
+        """
+        Validate bank account data and normalize it in place.
+
+        Args:
+            account_data: Dictionary containing bank account data
+
+        Returns:
+            Error message if invalid, None otherwise
+        """
         # Validate account holder name
         is_valid, error = validate_account_holder_name(
             account_data.get("account_holder_name", "")
         )
         if not is_valid:
-            return None, error
+            return error
 
         # Validate IBAN if provided
         if account_data.get("iban"):
             is_valid, error = validate_iban(account_data["iban"])
             if not is_valid:
-                return None, error
+                return error
             # Format IBAN
             account_data["iban"] = format_iban(account_data["iban"])
 
@@ -233,7 +297,7 @@ class BeneficiaryService:
         if account_data.get("swift_bic"):
             is_valid, error = validate_swift_bic(account_data["swift_bic"])
             if not is_valid:
-                return None, error
+                return error
             account_data["swift_bic"] = (
                 account_data["swift_bic"].replace(" ", "").upper()
             )
@@ -241,32 +305,27 @@ class BeneficiaryService:
         # Validate currency
         is_valid, error = validate_currency_code(account_data.get("currency", ""))
         if not is_valid:
-            return None, error
+            return error
         account_data["currency"] = account_data["currency"].upper()
 
-        # Ensure beneficiary_id is set
-        account_data["beneficiary_id"] = beneficiary_id
-
-        # Create bank account
-        account = self.bank_account_repo.create(account_data)
-
-        # Log the creation
-        self.audit_repo.create(
-            {
-                "user_id": user_id,
-                "entity_type": "bank_account",
-                "entity_id": account.id,
-                "action": "created",
-                "new_values": {
-                    "beneficiary_id": beneficiary_id,
-                    "currency": account.currency,
-                    "iban": account.iban[:10] + "****" if account.iban else None,
-                },
-            }
+        return None
+
+    @staticmethod
+    def _account_created_entry(
+        account: BeneficiaryBankAccount, user_id: int
+    ) -> AuditEntry:
+        return AuditEntry(
+            user_id,
+            "bank_account",
+            account.id,
+            "created",
+            new_values={
+                "beneficiary_id": account.beneficiary_id,
+                "currency": account.currency,
+                "iban": account.iban[:10] + "****" if account.iban else None,
+            },
         )
 
-        return account, None
-
     def get_beneficiary_accounts(
         self, beneficiary_id: int
     ) -> List[BeneficiaryBankAccount]:
@@ -292,18 +351,14 @@ class BeneficiaryService:
         Returns:
             True if deleted, False if not found
         """
-        success = self.bank_account_repo.delete(account_id)
+        with transaction(self.db):
+            success = self.bank_account_repo.delete(account_id)
 
-        if success:
-            # Log the deletion
-            self.audit_repo.create(
-                {
-                    "user_id": user_id,
-                    "entity_type": "bank_account",
-                    "entity_id": account_id,
-                    "action": "deleted",
-                }
-            )
+            if success:
+                # Log the deletion
+                self.audit_repo.create(
+                    AuditEntry(user_id, "bank_account", account_id, "deleted")
+                )
 
         return success
 
@@ -320,17 +375,13 @@ class BeneficiaryService:
         Returns:
             Updated bank account object if found, None otherwise
         """
-        account = self.bank_account_repo.set_default(account_id)
-
-        if account:
-            # Log the update
-            self.audit_repo.create(
-                {
-                    "user_id": user_id,
-                    "entity_type": "bank_account",
-                    "entity_id": account_id,
-                    "action": "set_default",
-                }
-            )
+        with transaction(self.db):
+            account = self.bank_account_repo.set_default(account_id)
+
+            if account:
+                # Log the update
+                self.audit_repo.create(
+                    AuditEntry(user_id, "bank_account", account_id, "set_default")
+                )
 
         return account
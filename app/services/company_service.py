@@ -4,10 +4,19 @@ Company service for business logic.
 
 from typing import Optional, Dict
 from sqlalchemy.orm import Session
+from app.database.connection import transaction
 from app.repositories.company_repository import CompanyRepository
-from app.repositories.audit_repository import AuditRepository
+from app.repositories.audit_repository import AuditEntry, AuditRepository
 from app.database.models import Company
 
+# Fields recorded in the audit trail when they change
+_AUDITED_FIELDS = (
+    "company_name",
+    "registered_country",
+    "industry_sector",
+    "fx_volume_band",
+)
+
 
 class CompanyService:
     """Service for company business logic."""
@@ -40,24 +49,25 @@ class CompanyService:
         Returns:
             Created company object
         """
-        # Create company
-        company = self.company_repo.create(company_data)
-
-        # Log the creation
-        self.audit_repo.create(
-            {
-                "user_id": user_id,
-                "entity_type": "company",
-                "entity_id": company.id,
-                "action": "created",
-                "new_values": {
-                    "company_name": company.company_name,
-                    "registered_country": company.registered_country,
-                    "industry_sector": company.industry_sector,
-                    "fx_volume_band": company.fx_volume_band,
-                },
-            }
-        )
+        with transaction(self.db):
+            # Create company
+            company = self.company_repo.create(company_data)
+
+            # Log the creation
+            self.audit_repo.create(
+                AuditEntry(
+                    user_id,
+                    "company",
+                    company.id,
+                    "created",
+                    new_values={
+                        "company_name": company.company_name,
+                        "registered_country": company.registered_country,
+                        "industry_sector": company.industry_sector,
+                        "fx_volume_band": company.fx_volume_band,
+                    },
+                )
+            )
 
         return company
 
@@ -75,39 +85,26 @@ class CompanyService:
         Returns:
             Updated company object if found, None otherwise
         """
-        # Get old values for audit
-        old_company = self.company_repo.get_by_id(company_id)
-        if not old_company:
-            return None
-
-        old_values = {
-            "company_name": old_company.company_name,
-            "registered_country": old_company.registered_country,
-            "industry_sector": old_company.industry_sector,
-            "fx_volume_band": old_company.fx_volume_band,
-        }
-
-        # Update company
-        company = self.company_repo.update(company_id, company_data)
-
-        if company:
-            # Log the update
-            self.audit_repo.create(
-                {
-                    "user_id": user_id,
-                    "entity_type": "company",
-                    "entity_id": company.id,
-                    "action": "updated",
-                    "old_values": old_values,
-                    "new_values": {
-                        "company_name": company.company_name,
-                        "registered_country": company.registered_country,
-                        "industry_sector": company.industry_sector,
-                        "fx_volume_band": company.fx_volume_band,
-                    },
-                }
+        with transaction(self.db):
+            company, changes = self.company_repo.update_with_changes(
+                company_id, company_data
             )
 
+            # Log the update with before/after values of the changed fields,
+            # only when one of them is an audited field
+            old_values = {k: changes[k] for k in _AUDITED_FIELDS if k in changes}
+            if old_values:
+                self.audit_repo.create(
+                    AuditEntry(
+                        user_id,
+                        "company",
+                        company.id,
+                        "updated",
+                        old_values=old_values,
+                        new_values={k: getattr(company, k) for k in old_values},
+                    )
+                )
+
         return company
 
     def get_company_summary(self, company_id: int) -> Optional[Dict]:
@@ -120,10 +117,11 @@ class CompanyService:
         Returns:
             Dictionary with company details and stats
         """
-        company = self.company_repo.get_by_id(company_id)
-        if not company:
+        summary = self.company_repo.get_summary(company_id)
+        if not summary:
             return None
 
+        company, user_count, beneficiary_count = summary
         return {
             "id": company.id,
             "company_name": company.company_name,
@@ -132,6 +130,6 @@ class CompanyService:
             "fx_volume_band": company.fx_volume_band,
             "created_at": company.created_at,
             "updated_at": company.updated_at,
-            "user_count": len(company.users),
-            "beneficiary_count": len(company.beneficiaries),
+            "user_count": user_count,
+            "beneficiary_count": beneficiary_count,
         }
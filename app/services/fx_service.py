@@ -2,16 +2,82 @@
 FX Quote service for business logic.
 """
 
-from typing import Optional, List, Dict
+import threading
+from functools import cache
+from typing import Callable, Iterable, Optional, List, Dict, Tuple, Union
 from decimal import Decimal
 from datetime import datetime, timedelta
+from cachetools import TTLCache
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
+from app.database.connection import transaction
 from app.repositories.fx_repository import FXQuoteRepository
-from app.repositories.audit_repository import AuditRepository
+from app.repositories.audit_repository import AuditEntry, AuditRepository
 from app.integrations.fx_provider import MockFXProvider, FixerIOProvider
 from app.database.models import FXQuote
 from app.config import config
 
+# Shared Decimal constants, built once instead of parsed on every call
+_ONE = Decimal(1)
+_HUNDRED = Decimal(100)
+_Q4 = Decimal("0.0001")
+_Q2 = Decimal("0.01")
+
+# Currency lists change at most daily; cached per provider and shared by
+# every FXService instance, since one is built per page run
+_CURRENCY_CACHE_TTL = 3600
+_CURRENCY_CACHE = TTLCache(maxsize=4, ttl=_CURRENCY_CACHE_TTL)
+_CURRENCY_CACHE_LOCK = threading.Lock()
+
+# Live rates per (provider, from, to), reused for bursts of quote panel
+# refreshes. Amounts are applied per call, so they are not part of the key.
+_LIVE_RATE_TTL = 3
+_LIVE_RATE_CACHE = TTLCache(maxsize=256, ttl=_LIVE_RATE_TTL)
+_LIVE_RATE_LOCK = threading.Lock()
+# Fetch locks striped by pair, so concurrent misses on a pair wait for a
+# single provider call without keeping a lock per pair ever requested
+_LIVE_RATE_FETCH_LOCKS = tuple(threading.Lock() for _ in range(16))
+
+
+def expire_currency_cache() -> None:
+    """Drop cached currency lists, e.g. after changing the FX provider."""
+    with _CURRENCY_CACHE_LOCK:
+        _CURRENCY_CACHE.clear()
+
+
+@cache
+def get_fx_provider() -> Tuple[Union[FixerIOProvider, MockFXProvider], str]:
+    """
+    Create the FX rate provider once per process.
+
+    Every FXService shares it, so the Fixer.io HTTP session keeps its
+    pooled connections and the provider caches stay warm across page runs.
+
+    Returns:
+        Tuple of (provider, provider display name)
+    """
+    # Use Fixer.io if API key is configured, otherwise fall back to mock
+    if config.FX_PROVIDER_API_KEY:
+        try:
+            provider = FixerIOProvider(
+                api_key=config.FX_PROVIDER_API_KEY,
+                base_url=config.FX_PROVIDER_API_URL or "http://data.fixer.io/api",
+            )
+            return provider, "Fixer.io"
+        except ValueError as e:
+            print(f"Failed to initialize Fixer.io provider: {e}. Falling back to mock.")
+
+    provider = MockFXProvider(
+        api_key=config.FX_PROVIDER_API_KEY, api_url=config.FX_PROVIDER_API_URL
+    )
+    return provider, "Mock"
+
+
+@cache
+def _markup_percentage() -> Decimal:
+    # Configuration is fixed for the life of the process
+    return Decimal(str(config.FX_MARKUP_PERCENTAGE))
+
 
 class FXService:
     """Service for FX quote business logic."""
@@ -21,30 +87,10 @@ class FXService:
         self.fx_repo = FXQuoteRepository(db)
         self.audit_repo = AuditRepository(db)
 
-        # Use Fixer.io if API key is configured, otherwise fall back to mock
-        if config.FX_PROVIDER_API_KEY:
-            try:
-                self.fx_provider = FixerIOProvider(
-                    api_key=config.FX_PROVIDER_API_KEY,
-                    base_url=config.FX_PROVIDER_API_URL or "http://data.fixer.io/api",
-                )
-                self.provider_name = "Fixer.io"
-            except ValueError as e:
-                print(
-                    f"Failed to initialize Fixer.io provider: {e}. Falling back to mock."
-                )
-                self.fx_provider = MockFXProvider(
-                    api_key=config.FX_PROVIDER_API_KEY,
-                    api_url=config.FX_PROVIDER_API_URL,
-                )
-                self.provider_name = "Mock"
-        else:
-            self.fx_provider = MockFXProvider(
-                api_key=config.FX_PROVIDER_API_KEY, api_url=config.FX_PROVIDER_API_URL
-            )
-            self.provider_name = "Mock"
+        self.fx_provider, self.provider_name = get_fx_provider()
 
-        self.markup_percentage = Decimal(str(config.FX_MARKUP_PERCENTAGE))
+        self.markup_percentage = _markup_percentage()
+        self._markup_multiplier = _ONE + self.markup_percentage
 
     def get_live_rate(
         self, from_currency: str, to_currency: str, amount: Optional[Decimal] = None
@@ -52,6 +98,9 @@ class FXService:
         """
         Get live FX rate from provider.
 
+        The pair's rate is reused for a few seconds across service
+        instances; the amount is converted locally on every call.
+
         Args:
             from_currency: Source currency code
             to_currency: Target currency code
@@ -59,8 +108,50 @@ class FXService:
 
         Returns:
             Dictionary with rate information
+
+        Raises:
+            ValueError: If the provider has no rate for the pair
         """
-        return self.fx_provider.get_rate(from_currency, to_currency, amount)
+        key = (self.provider_name, from_currency.upper(), to_currency.upper())
+        with _LIVE_RATE_LOCK:
+            rate_info = _LIVE_RATE_CACHE.get(key)
+
+        if rate_info is None:
+            with _LIVE_RATE_FETCH_LOCKS[hash(key) % len(_LIVE_RATE_FETCH_LOCKS)]:
+                with _LIVE_RATE_LOCK:
+                    rate_info = _LIVE_RATE_CACHE.get(key)
+                if rate_info is None:
+                    # Raises on failure, so only real rates are cached
+                    rate_info = self._fetch_rate_info(key[1], key[2])
+                    with _LIVE_RATE_LOCK:
+                        _LIVE_RATE_CACHE[key] = rate_info
+
+        result = dict(rate_info)
+        if amount:
+            result["source_amount"] = amount
+            result["target_amount"] = (amount * result["rate"]).quantize(_Q2)
+        return result
+
+    def _fetch_rate_info(self, from_currency: str, to_currency: str) -> Dict:
+        """
+        Fetch a rate from the provider in the mock provider's dict shape.
+
+        FixerIOProvider.get_rate() returns a bare Decimal, or None when the
+        rate is unavailable.
+        """
+        rate = self.fx_provider.get_rate(from_currency, to_currency)
+        if isinstance(rate, dict):
+            return rate
+        if rate is None:
+            raise ValueError(f"No live rate for {from_currency}/{to_currency}")
+        return {
+            "from_currency": from_currency,
+            "to_currency": to_currency,
+            "rate": rate,
+            "inverse_rate": (_ONE / rate).quantize(_Q4),
+            "timestamp": datetime.utcnow().isoformat(),
+            "provider": self.provider_name,
+        }
 
     def request_quote(
         self,
@@ -100,11 +191,11 @@ class FXService:
 
             # Calculate rate with markup
             base_rate = provider_quote["rate"]
-            markup_rate = base_rate * (Decimal("1.0") + self.markup_percentage)
-            final_rate = markup_rate.quantize(Decimal("0.0001"))
+            markup_rate = base_rate * self._markup_multiplier
+            final_rate = markup_rate.quantize(_Q4)
 
             # Calculate target amount with markup
-            target_amount = (amount * final_rate).quantize(Decimal("0.01"))
+            target_amount = (amount * final_rate).quantize(_Q2)
 
             # Create quote in database
             quote_data = {
@@ -119,23 +210,24 @@ class FXService:
                 "is_expired": False,
             }
 
-            quote = self.fx_repo.create(quote_data)
-
-            # Log the quote request
-            self.audit_repo.create(
-                {
-                    "user_id": user_id,
-                    "entity_type": "fx_quote",
-                    "entity_id": quote.id,
-                    "action": "requested",
-                    "new_values": {
-                        "quote_id": quote.quote_id,
-                        "currency_pair": f"{from_currency}/{to_currency}",
-                        "rate": str(final_rate),
-                        "amount": str(amount),
-                    },
-                }
-            )
+            with transaction(self.db):
+                quote = self.fx_repo.create(quote_data)
+
+                # Log the quote request
+                self.audit_repo.create(
+                    AuditEntry(
+                        user_id,
+                        "fx_quote",
+                        quote.id,
+                        "requested",
+                        new_values={
+                            "quote_id": quote.quote_id,
+                            "currency_pair": f"{from_currency}/{to_currency}",
+                            "rate": str(final_rate),
+                            "amount": str(amount),
+                        },
+                    )
+                )
 
             return quote, None
 
@@ -169,6 +261,25 @@ class FXService:
         """
         return self.fx_repo.get_by_company(company_id, include_expired)
 
+    def get_recent_quote_summaries(
+        self, company_id: int, days: int = 7, limit: int = 20
+    ) -> List[Row]:
+        """
+        Get recent quotes for a company as lightweight rows for list views.
+
+        The rows carry is_expired and quote_expires_at, so they can be
+        passed to is_quote_valid().
+
+        Args:
+            company_id: Company ID
+            days: Number of days to look back
+            limit: Maximum number of quotes to return
+
+        Returns:
+            List of quote summary rows, newest first
+        """
+        return self.fx_repo.get_recent_quote_summaries(company_id, days, limit)
+
     def get_active_quotes(
         self, company_id: int, currency_pair: Optional[tuple] = None
     ) -> List[FXQuote]:
@@ -184,12 +295,16 @@ class FXService:
         """
         return self.fx_repo.get_active_quotes(company_id, currency_pair)
 
-    def is_quote_valid(self, quote: FXQuote) -> bool:
+    def is_quote_valid(self, quote: FXQuote, now: Optional[datetime] = None) -> bool:
         """
         Check if a quote is still valid.
 
+        Read-only: quotes past expiry are flagged in bulk by
+        expire_old_quotes() (scripts/expire_quotes.py), not here.
+
         Args:
             quote: FXQuote object
+            now: Current UTC time; pass one value when checking a whole list
 
         Returns:
             True if valid, False if expired
@@ -197,27 +312,25 @@ class FXService:
         if quote.is_expired:
             return False
 
-        if quote.quote_expires_at < datetime.utcnow():
-            # Mark as expired in database
-            self.fx_repo.mark_expired(quote.id)
-            return False
-
-        return True
+        return quote.quote_expires_at >= (now or datetime.utcnow())
 
-    def get_quote_time_remaining(self, quote: FXQuote) -> int:
+    def get_quote_time_remaining(
+        self, quote: FXQuote, now: Optional[datetime] = None
+    ) -> int:
         """
         Get seconds remaining before quote expires.
 
         Args:
             quote: FXQuote object
+            now: Current UTC time; pass one value when checking a whole list
 
         Returns:
             Seconds remaining (0 if expired)
         """
-        if not self.is_quote_valid(quote):
+        if quote.is_expired:
             return 0
 
-        delta = quote.quote_expires_at - datetime.utcnow()
+        delta = quote.quote_expires_at - (now or datetime.utcnow())
         return max(0, int(delta.total_seconds()))
 
     def calculate_amount(
@@ -233,10 +346,10 @@ class FXService:
         Returns:
             Dictionary with calculated amounts and fees
         """
-        target_amount = (source_amount * quote.final_rate).quantize(Decimal("0.01"))
+        target_amount = (source_amount * quote.final_rate).quantize(_Q2)
 
         # Calculate markup fee (difference between base and final rate)
-        base_target_amount = (source_amount * quote.rate).quantize(Decimal("0.01"))
+        base_target_amount = (source_amount * quote.rate).quantize(_Q2)
         markup_fee = target_amount - base_target_amount
 
         return {
@@ -245,8 +358,7 @@ class FXService:
             "exchange_rate": quote.final_rate,
             "base_rate": quote.rate,
             "markup_fee": markup_fee,
-            "markup_percentage": quote.markup_percentage
-            * Decimal("100"),  # Convert to %
+            "markup_percentage": quote.markup_percentage * _HUNDRED,  # Convert to %
         }
 
     def get_supported_currencies(self) -> List[str]:
@@ -256,7 +368,9 @@ class FXService:
         Returns:
             List of currency codes
         """
-        return self.fx_provider.get_supported_currencies()
+        return self._cached_currency_list(
+            "currencies", self.fx_provider.get_supported_currencies
+        )
 
     def get_currency_pairs(self) -> List[tuple]:
         """
@@ -265,7 +379,18 @@ class FXService:
         Returns:
             List of tuples (from_currency, to_currency)
         """
-        return self.fx_provider.get_currency_pairs()
+        return self._cached_currency_list("pairs", self.fx_provider.get_currency_pairs)
+
+    def _cached_currency_list(self, kind: str, load: Callable[[], Iterable]) -> list:
+        key = (self.provider_name, kind)
+        with _CURRENCY_CACHE_LOCK:
+            values = _CURRENCY_CACHE.get(key)
+        if values is None:
+            values = tuple(load())
+            with _CURRENCY_CACHE_LOCK:
+                _CURRENCY_CACHE[key] = values
+        # A fresh list per call, so callers cannot mutate the cached copy
+        return list(values)
 
     def get_quote_statistics(self, company_id: int, days: int = 30) -> Dict:
         """
@@ -280,14 +405,26 @@ class FXService:
         """
         return self.fx_repo.get_quote_statistics(company_id, days)
 
-    def expire_old_quotes(self) -> int:
+    def expire_old_quotes(self, batch_size: int = 5000) -> int:
         """
         Mark all expired quotes in database.
 
+        Works in batches committed one at a time, so no single UPDATE holds
+        locks on the whole backlog. Safe to run repeatedly.
+
+        Args:
+            batch_size: Number of quotes updated per transaction
+
         Returns:
             Number of quotes expired
         """
-        return self.fx_repo.expire_old_quotes()
+        total = 0
+        while True:
+            expired = self.fx_repo.expire_quote_batch(batch_size)
+            self.db.commit()
+            total += expired
+            if expired < batch_size:
+                return total
 
     def get_rate_breakdown(self, quote: FXQuote) -> Dict:
         """
@@ -301,15 +438,9 @@ class FXService:
         """
         return {
             "base_rate": quote.rate,
-            "markup_percentage": (quote.markup_percentage * Decimal("100")).quantize(
-                Decimal("0.01")
-            ),
-            "markup_amount": (quote.rate * quote.markup_percentage).quantize(
-                Decimal("0.0001")
-            ),
+            "markup_percentage": (quote.markup_percentage * _HUNDRED).quantize(_Q2),
+            "markup_amount": (quote.rate * quote.markup_percentage).quantize(_Q4),
             "final_rate": quote.final_rate,
             "currency_pair": f"{quote.source_currency}/{quote.target_currency}",
-            "inverse_rate": (Decimal("1.0") / quote.final_rate).quantize(
-                Decimal("0.0001")
-            ),
+            "inverse_rate": (_ONE / quote.final_rate).quantize(_Q4),
         }
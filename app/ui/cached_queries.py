@@ -0,0 +1,293 @@
+"""
+Cached read-only queries for Streamlit pages.
+
+Streamlit reruns the page script on every widget interaction. These wrappers
+cache read-mostly lookups across reruns so view-only interactions skip the
+database. Results are plain dictionaries, since ORM objects are bound to the
+session that loaded them. Pages clear the relevant cache after a write.
+"""
+
+from collections import Counter
+from typing import TYPE_CHECKING, Optional, List, Dict
+import streamlit as st
+from app.database.connection import SessionLocal
+from app.database.models import Beneficiary, Company, User
+from app.repositories.beneficiary_repository import BeneficiaryRepository
+from app.repositories.company_repository import CompanyRepository
+from app.repositories.user_repository import UserRepository
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+COMPANY_TTL_SECONDS = 300
+LIST_TTL_SECONDS = 60
+
+
+def _company_to_dict(company: Company) -> Dict:
+    return {
+        "id": company.id,
+        "company_name": company.company_name,
+        "registered_country": company.registered_country,
+        "industry_sector": company.industry_sector,
+        "fx_volume_band": company.fx_volume_band,
+        "created_at": company.created_at,
+        "updated_at": company.updated_at,
+    }
+
+
+def _user_to_dict(user: User) -> Dict:
+    return {
+        "id": user.id,
+        "full_name": user.full_name,
+        "email": user.email,
+        "role": user.role,
+        "is_active": user.is_active,
+        "created_at": user.created_at,
+    }
+
+
+def _beneficiaries_to_dicts(beneficiaries: List[Beneficiary]) -> List[Dict]:
+    # bank_accounts is selectin-loaded, so this is one extra query per list
+    return [
+        {
+            "id": ben.id,
+            "beneficiary_name": ben.beneficiary_name,
+            "beneficiary_type": ben.beneficiary_type,
+            "country": ben.country,
+            "is_active": ben.is_active,
+            "created_at": ben.created_at,
+            "accounts": [
+                {
+                    "id": account.id,
+                    "currency": account.currency,
+                    "iban": account.iban,
+                    "swift_bic": account.swift_bic,
+                    "bank_name": account.bank_name,
+                    "is_default": account.is_default,
+                }
+                for account in ben.bank_accounts
+            ],
+        }
+        for ben in beneficiaries
+    ]
+
+
+@st.cache_data(ttl=COMPANY_TTL_SECONDS)
+def load_company(company_id: int) -> Optional[Dict]:
+    """
+    Get company details by ID.
+
+    Args:
+        company_id: Company ID
+
+    Returns:
+        Company dictionary if found, None otherwise
+    """
+    db = SessionLocal()
+    try:
+        company = CompanyRepository(db).get_by_id(company_id)
+        return _company_to_dict(company) if company else None
+    finally:
+        db.close()
+
+
+@st.cache_data(ttl=COMPANY_TTL_SECONDS)
+def load_companies() -> List[Dict]:
+    """
+    Get all companies.
+
+    Returns:
+        List of company dictionaries
+    """
+    db = SessionLocal()
+    try:
+        return [_company_to_dict(c) for c in CompanyRepository(db).get_all()]
+    finally:
+        db.close()
+
+
+@st.cache_data(ttl=LIST_TTL_SECONDS)
+def load_company_users(company_id: int) -> List[Dict]:
+    """
+    Get all users for a company.
+
+    Args:
+        company_id: Company ID
+
+    Returns:
+        List of user dictionaries (without credentials)
+    """
+    db = SessionLocal()
+    try:
+        users = UserRepository(db).get_by_company(company_id)
+        return [_user_to_dict(user) for user in users]
+    finally:
+        db.close()
+
+
+@st.cache_data(ttl=LIST_TTL_SECONDS)
+def load_company_beneficiaries(
+    company_id: int, include_inactive: bool = False
+) -> List[Dict]:
+    """
+    Get beneficiaries for a company with their bank accounts.
+
+    Args:
+        company_id: Company ID
+        include_inactive: Whether to include inactive beneficiaries
+
+    Returns:
+        List of beneficiary dictionaries, each with an "accounts" list
+    """
+    db = SessionLocal()
+    try:
+        beneficiaries = BeneficiaryRepository(db).get_by_company(
+            company_id, include_inactive
+        )
+        return _beneficiaries_to_dicts(beneficiaries)
+    finally:
+        db.close()
+
+
+@st.cache_data(ttl=LIST_TTL_SECONDS)
+def search_company_beneficiaries(company_id: int, search_term: str) -> List[Dict]:
+    """
+    Search beneficiaries by name or country.
+
+    Args:
+        company_id: Company ID
+        search_term: Search term
+
+    Returns:
+        List of matching beneficiary dictionaries, each with an "accounts" list
+    """
+    db = SessionLocal()
+    try:
+        beneficiaries = BeneficiaryRepository(db).search(company_id, search_term)
+        return _beneficiaries_to_dicts(beneficiaries)
+    finally:
+        db.close()
+
+
+@st.cache_data(ttl=LIST_TTL_SECONDS)
+def load_user_table(company_id: int) -> "pd.DataFrame":
+    """
+    Get the user management table for a company.
+
+    Args:
+        company_id: Company ID
+
+    Returns:
+        DataFrame with one display row per user
+    """
+    # Only admins see this table; other sessions never import pandas
+    import pandas as pd
+
+    return pd.DataFrame(
+        [
+            {
+                "Full Name": user["full_name"],
+                "Email": user["email"],
+                "Role": user["role"].title(),
+                "Status": "Active" if user["is_active"] else "Inactive",
+                "Created": user["created_at"].strftime("%Y-%m-%d"),
+            }
+            for user in load_company_users(company_id)
+        ]
+    )
+
+
+def _listed_beneficiaries(company_id: int, search_term: str) -> List[Dict]:
+    # What the beneficiary page lists: search results, or everyone
+    if search_term:
+        return search_company_beneficiaries(company_id, search_term)
+    return load_company_beneficiaries(company_id, include_inactive=True)
+
+
+@st.cache_data(ttl=LIST_TTL_SECONDS)
+def load_beneficiary_table(company_id: int, search_term: str = "") -> "pa.Table":
+    """
+    Get the beneficiary list table for a company.
+
+    Shows the default bank account of each beneficiary, or its first
+    account if none is marked default. Built as an Arrow table, which
+    st.dataframe sends to the browser as is.
+
+    Args:
+        company_id: Company ID
+        search_term: Optional search term; all beneficiaries if empty
+
+    Returns:
+        Arrow table with one display row per beneficiary
+    """
+    import pyarrow as pa
+
+    columns = {
+        "Name": [],
+        "Type": [],
+        "Country": [],
+        "Currency": [],
+        "IBAN": [],
+        "Status": [],
+        "Created": [],
+    }
+    for ben in _listed_beneficiaries(company_id, search_term):
+        accounts = ben["accounts"]
+        default_account = next(
+            (acc for acc in accounts if acc["is_default"]),
+            accounts[0] if accounts else None,
+        )
+        columns["Name"].append(ben["beneficiary_name"])
+        columns["Type"].append(ben["beneficiary_type"].title())
+        columns["Country"].append(ben["country"])
+        columns["Currency"].append(
+            default_account["currency"] if default_account else "N/A"
+        )
+        columns["IBAN"].append(
+            default_account["iban"][:10] + "****"
+            if default_account and default_account["iban"]
+            else "N/A"
+        )
+        columns["Status"].append("Active" if ben["is_active"] else "Inactive")
+        columns["Created"].append(ben["created_at"].date())
+    return pa.table(columns)
+
+
+@st.cache_data(ttl=LIST_TTL_SECONDS)
+def load_beneficiary_stats(company_id: int, search_term: str = "") -> Dict:
+    """
+    Get summary statistics for the beneficiary list.
+
+    Args:
+        company_id: Company ID
+        search_term: Optional search term; all beneficiaries if empty
+
+    Returns:
+        Dictionary with total and active counts, the most used account
+        currency (None if there are no accounts) and the number of countries
+    """
+    beneficiaries = _listed_beneficiaries(company_id, search_term)
+    currencies = Counter(
+        account["currency"] for ben in beneficiaries for account in ben["accounts"]
+    )
+    return {
+        "total": len(beneficiaries),
+        "active": sum(1 for ben in beneficiaries if ben["is_active"]),
+        "top_currency": currencies.most_common(1)[0][0] if currencies else None,
+        "countries": len({ben["country"] for ben in beneficiaries}),
+    }
+
+
+def clear_company_cache() -> None:
+    """Drop cached company lookups after a company write."""
+    load_company.clear()
+    load_companies.clear()
+
+
+def clear_beneficiary_cache() -> None:
+    """Drop cached beneficiary lookups after a beneficiary or account write."""
+    load_company_beneficiaries.clear()
+    search_company_beneficiaries.clear()
+    load_beneficiary_table.clear()
+    load_beneficiary_stats.clear()
@@ -0,0 +1,39 @@
+"""
+Page-by-page display of long tables.
+"""
+
+import streamlit as st
+
+DEFAULT_PAGE_SIZE = 25
+
+
+def paginate(data, key: str, page_size: int = DEFAULT_PAGE_SIZE):
+    """
+    Slice a table to the page the user has selected.
+
+    Only the returned rows are handed to st.dataframe, so the payload sent
+    to the browser stays at one page however long the table grows. The
+    page selector is only shown when there is more than one page.
+
+    Args:
+        data: DataFrame to paginate
+        key: Unique widget key for the page selector
+        page_size: Rows per page
+
+    Returns:
+        The rows of the selected page
+    """
+    page_count = max(1, -(-len(data) // page_size))
+    if page_count == 1:
+        return data
+
+    page = st.number_input(
+        f"Page (of {page_count})",
+        min_value=1,
+        max_value=page_count,
+        value=1,
+        step=1,
+        key=key,
+    )
+    start = (page - 1) * page_size
+    return data.iloc[start : start + page_size]
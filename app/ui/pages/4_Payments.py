@@ -4,7 +4,148 @@ Payment Management Page
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from app.ui.components.pagination import paginate
+
+# Row labels of the cost breakdown table on the create payment tab
+_BREAKDOWN_ITEMS = (
+    "Source Amount",
+    "FX Rate",
+    "Target Amount",
+    "Fee (0.1%)",
+    "Total Debit",
+)
+
+# Low-cardinality columns, stored as categories (one small code per row)
+_CATEGORY_COLUMNS = dict.fromkeys(("Beneficiary", "Status", "Created By"), "category")
+
+# Mock payment list, one row per payment, newest first
+_PAYMENT_COLUMNS = (
+    "Payment ID",
+    "Beneficiary",
+    "Source",
+    "Target",
+    "FX Rate",
+    "Status",
+    "Created By",
+)
+_PAYMENT_ROWS = (
+    (
+        "PAY-001",
+        "Supplier GmbH",
+        "GBP 10,500.00",
+        "EUR 12,208.50",
+        "1.1627",
+        "Pending Approval",
+        "Maker User",
+    ),
+    (
+        "PAY-002",
+        "Tech Solutions SAS",
+        "GBP 25,000.00",
+        "USD 32,125.00",
+        "1.2850",
+        "Completed",
+        "Maker User",
+    ),
+    (
+        "PAY-003",
+        "Global Trade SpA",
+        "GBP 5,750.00",
+        "EUR 6,686.25",
+        "1.1627",
+        "Completed",
+        "Maker User",
+    ),
+    (
+        "PAY-004",
+        "Manufacturing BV",
+        "GBP 18,200.00",
+        "EUR 21,163.00",
+        "1.1627",
+        "Draft",
+        "Maker User",
+    ),
+    (
+        "PAY-005",
+        "Export Services Ltd",
+        "GBP 12,900.00",
+        "USD 16,576.50",
+        "1.2850",
+        "Processing",
+        "Maker User",
+    ),
+    (
+        "PAY-006",
+        "European Partners AG",
+        "GBP 8,450.00",
+        "EUR 9,823.75",
+        "1.1627",
+        "Approved",
+        "Maker User",
+    ),
+    (
+        "PAY-007",
+        "Digital Consulting",
+        "GBP 15,600.00",
+        "EUR 18,144.00",
+        "1.1627",
+        "Rejected",
+        "Maker User",
+    ),
+    (
+        "PAY-008",
+        "Import Co SARL",
+        "GBP 22,100.00",
+        "EUR 25,706.50",
+        "1.1627",
+        "Failed",
+        "Finance Manager",
+    ),
+    (
+        "PAY-009",
+        "Supplier GmbH",
+        "GBP 9,800.00",
+        "EUR 11,397.00",
+        "1.1627",
+        "Pending Approval",
+        "Maker User",
+    ),
+    (
+        "PAY-010",
+        "Tech Solutions SAS",
+        "GBP 31,200.00",
+        "USD 40,092.00",
+        "1.2850",
+        "Completed",
+        "Finance Manager",
+    ),
+)
+
+
+@st.cache_data(ttl="5m")
+def _load_payments(today: date) -> pd.DataFrame:
+    """Build the mock payment list, dated relative to today."""
+    # Newest first, one payment per day
+    created = pd.date_range(end=today, periods=10, freq="D")[::-1]
+
+    payments = pd.DataFrame.from_records(_PAYMENT_ROWS, columns=_PAYMENT_COLUMNS)
+    payments["Created Date"] = created.strftime("%Y-%m-%d")
+    return payments.astype(_CATEGORY_COLUMNS)
+
+
+@st.cache_data
+def _load_approval_history() -> pd.DataFrame:
+    """Build the mock approval history for the payment details tab."""
+    return pd.DataFrame(
+        {
+            "Timestamp": ["2026-01-11 10:35:22"],
+            "User": ["Maker User"],
+            "Action": ["Submitted for Approval"],
+            "Comments": ["Urgent payment - please review ASAP"],
+        }
+    )
+
 
 st.set_page_config(page_title="Payments", page_icon="", layout="wide")
 
@@ -16,22 +157,22 @@ if not st.session_state.get("authenticated", False):
 st.title(" Payment Management")
 st.markdown("---")
 
-# Only Makers and Admins can create payments
-can_create = st.session_state.user_role in ["admin", "maker"]
+# Only Makers and Admins can create payments (resolved at login)
+can_create = st.session_state.get("can_create", False)
 
-# Tabs for different views
-tab1, tab2, tab3 = st.tabs(
-    [" All Payments", " Create Payment", " Payment Details"]
-)
 
-with tab1:
+@st.fragment
+def _render_payment_list(can_create: bool):
+    """Render the payment list tab."""
+    today = date.today()
+
     st.subheader("Payment List")
 
     # Filters
     col1, col2, col3, col4, col5 = st.columns(5)
 
     with col1:
-        filter_status = st.selectbox(
+        st.selectbox(
             "Status",
             [
                 "All",
@@ -46,15 +187,13 @@ with tab1:
         )
 
     with col2:
-        filter_currency = st.selectbox("Currency", ["All", "GBP", "EUR", "USD", "CHF"])
+        st.selectbox("Currency", ["All", "GBP", "EUR", "USD", "CHF"])
 
     with col3:
-        filter_date_from = st.date_input(
-            "From Date", datetime.now() - timedelta(days=30)
-        )
+        st.date_input("From Date", today - timedelta(days=30))
 
     with col4:
-        filter_date_to = st.date_input("To Date", datetime.now())
+        st.date_input("To Date", today)
 
     with col5:
         if can_create:
@@ -65,110 +204,11 @@ with tab1:
     st.markdown("---")
 
     # Mock payment data
-    payments_data = pd.DataFrame(
-        {
-            "Payment ID": [
-                "PAY-001",
-                "PAY-002",
-                "PAY-003",
-                "PAY-004",
-                "PAY-005",
-                "PAY-006",
-                "PAY-007",
-                "PAY-008",
-                "PAY-009",
-                "PAY-010",
-            ],
-            "Beneficiary": [
-                "Supplier GmbH",
-                "Tech Solutions SAS",
-                "Global Trade SpA",
-                "Manufacturing BV",
-                "Export Services Ltd",
-                "European Partners AG",
-                "Digital Consulting",
-                "Import Co SARL",
-                "Supplier GmbH",
-                "Tech Solutions SAS",
-            ],
-            "Source": [
-                "GBP 10,500.00",
-                "GBP 25,000.00",
-                "GBP 5,750.00",
-                "GBP 18,200.00",
-                "GBP 12,900.00",
-                "GBP 8,450.00",
-                "GBP 15,600.00",
-                "GBP 22,100.00",
-                "GBP 9,800.00",
-                "GBP 31,200.00",
-            ],
-            "Target": [
-                "EUR 12,208.50",
-                "USD 32,125.00",
-                "EUR 6,686.25",
-                "EUR 21,163.00",
-                "USD 16,576.50",
-                "EUR 9,823.75",
-                "EUR 18,144.00",
-                "EUR 25,706.50",
-                "EUR 11,397.00",
-                "USD 40,092.00",
-            ],
-            "FX Rate": [
-                "1.1627",
-                "1.2850",
-                "1.1627",
-                "1.1627",
-                "1.2850",
-                "1.1627",
-                "1.1627",
-                "1.1627",
-                "1.1627",
-                "1.2850",
-            ],
-            "Status": [
-                "Pending Approval",
-                "Completed",
-                "Completed",
-                "Draft",
-                "Processing",
-                "Approved",
-                "Rejected",
-                "Failed",
-                "Pending Approval",
-                "Completed",
-            ],
-            "Created By": [
-                "Maker User",
-                "Maker User",
-                "Maker User",
-                "Maker User",
-                "Maker User",
-                "Maker User",
-                "Maker User",
-                "Finance Manager",
-                "Maker User",
-                "Finance Manager",
-            ],
-            "Created Date": [
-                (datetime.now() - timedelta(days=0)).strftime("%Y-%m-%d"),
-                (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d"),
-                (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d"),
-                (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d"),
-                (datetime.now() - timedelta(days=4)).strftime("%Y-%m-%d"),
-                (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d"),
-                (datetime.now() - timedelta(days=6)).strftime("%Y-%m-%d"),
-                (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d"),
-                (datetime.now() - timedelta(days=8)).strftime("%Y-%m-%d"),
-                (datetime.now() - timedelta(days=9)).strftime("%Y-%m-%d"),
-            ],
-        }
-    )
+    payments_data = _load_payments(today)
 
-    # Display payments
+    # Display payments, one page at a time
     st.dataframe(
-        payments_data,
+        paginate(payments_data, key="payment_list_page"),
         use_container_width=True,
         hide_index=True,
         column_config={
@@ -199,7 +239,12 @@ with tab1:
     with col5:
         st.metric("Failed/Rejected", "2", "-1")
 
-with tab2:
+
+@st.fragment
+def _render_create_payment(can_create: bool):
+    """Render the create payment tab."""
+    today = date.today()
+
     st.subheader("Create New Payment")
 
     if not can_create:
@@ -212,7 +257,7 @@ with tab2:
             with col1:
                 st.markdown("**Beneficiary Selection**")
 
-                beneficiary = st.selectbox(
+                st.selectbox(
                     "Select Beneficiary *",
                     [
                         "Supplier GmbH (Germany, EUR)",
@@ -222,19 +267,19 @@ with tab2:
                     ],
                 )
 
-                bank_account = st.selectbox(
+                st.selectbox(
                     "Bank Account *", ["DE89370400440532013000 - Deutsche Bank (EUR)"]
                 )
 
                 st.markdown("---")
                 st.markdown("**Payment Details**")
 
-                source_currency = st.selectbox(
+                st.selectbox(
                     "Source Currency *",
                     ["GBP - British Pound", "EUR - Euro", "USD - US Dollar"],
                 )
 
-                target_currency = st.selectbox(
+                st.selectbox(
                     "Target Currency *",
                     ["EUR - Euro", "USD - US Dollar", "GBP - British Pound"],
                     disabled=True,
@@ -284,14 +329,14 @@ with tab2:
                 st.markdown("---")
                 st.markdown("**Additional Information**")
 
-                execution_date = st.date_input(
+                st.date_input(
                     "Execution Date *",
-                    value=datetime.now(),
-                    min_value=datetime.now(),
-                    max_value=datetime.now() + timedelta(days=30),
+                    value=today,
+                    min_value=today,
+                    max_value=today + timedelta(days=30),
                 )
 
-                payment_reference = st.text_input(
+                st.text_input(
                     "Payment Reference",
                     placeholder="Invoice INV-2026-001",
                     help="Internal reference for this payment",
@@ -307,7 +352,7 @@ with tab2:
                 use_existing_quote = st.checkbox("Use existing FX quote")
 
                 if use_existing_quote:
-                    quote_id = st.selectbox(
+                    st.selectbox(
                         "Select Quote",
                         [
                             "QT-20260111103045 (Rate: 1.1707, Expires: 1m 45s)",
@@ -326,13 +371,7 @@ with tab2:
 
                 breakdown_df = pd.DataFrame(
                     {
-                        "Item": [
-                            "Source Amount",
-                            "FX Rate",
-                            "Target Amount",
-                            "Fee (0.1%)",
-                            "Total Debit",
-                        ],
+                        "Item": _BREAKDOWN_ITEMS,
                         "Value": [
                             f"GBP {source_amount:,.2f}",
                             f"{fx_rate:.6f}",
@@ -347,7 +386,7 @@ with tab2:
 
             st.markdown("---")
 
-            purpose = st.text_area(
+            st.text_area(
                 "Payment Purpose *",
                 placeholder="Describe the purpose of this payment",
                 help="Required for compliance and record-keeping",
@@ -372,7 +411,10 @@ with tab2:
                     st.success(" Payment submitted for approval!")
                     st.balloons()
 
-with tab3:
+
+@st.fragment
+def _render_payment_details():
+    """Render the payment details tab."""
     st.subheader("Payment Details")
 
     payment_id = st.selectbox(
@@ -427,14 +469,7 @@ with tab3:
 
     st.markdown("**Approval History**")
 
-    approval_data = pd.DataFrame(
-        {
-            "Timestamp": ["2026-01-11 10:35:22"],
-            "User": ["Maker User"],
-            "Action": ["Submitted for Approval"],
-            "Comments": ["Urgent payment - please review ASAP"],
-        }
-    )
+    approval_data = _load_approval_history()
 
     st.dataframe(approval_data, use_container_width=True, hide_index=True)
 
@@ -452,6 +487,19 @@ with tab3:
             if st.button(" Cancel Payment", use_container_width=True):
                 st.warning("This will cancel the payment and notification will be sent")
 
+
+# Tabs for different views
+tab1, tab2, tab3 = st.tabs([" All Payments", " Create Payment", " Payment Details"])
+
+with tab1:
+    _render_payment_list(can_create)
+
+with tab2:
+    _render_create_payment(can_create)
+
+with tab3:
+    _render_payment_details()
+
 # Sidebar info
 with st.sidebar:
     st.info(f"**Logged in as:** {st.session_state.user_name}")
@@ -4,7 +4,88 @@ Payment Approval Page
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
+
+
+@st.cache_data(ttl="5m")
+def _load_pending(now: datetime) -> pd.DataFrame:
+    """Build the mock payments awaiting approval, timed relative to now."""
+    age = pd.to_timedelta([2, 5, 24], unit="h")
+
+    table = pd.DataFrame(
+        {
+            "Payment ID": ["PAY-001", "PAY-009", "PAY-012"],
+            "Beneficiary": ["Supplier GmbH", "Supplier GmbH", "Tech Solutions SAS"],
+            "Source Amount": ["GBP 10,500.00", "GBP 9,800.00", "GBP 15,200.00"],
+            "Target Amount": ["EUR 12,208.50", "EUR 11,397.00", "EUR 17,683.00"],
+            "Created By": ["Maker User", "Maker User", "Finance Manager"],
+            "Submitted": (now - age).strftime("%Y-%m-%d %H:%M"),
+            "Priority": [" Urgent", "🟡 Normal", "🟡 Normal"],
+        }
+    )
+    return table.astype(dict.fromkeys(("Beneficiary", "Created By"), "category"))
+
+
+@st.cache_data(ttl="5m")
+def _load_approved(now: datetime) -> pd.DataFrame:
+    """Build the mock approved payments, timed relative to now."""
+    age = pd.to_timedelta([1, 2, 5, 9], unit="D")
+
+    table = pd.DataFrame(
+        {
+            "Payment ID": ["PAY-002", "PAY-003", "PAY-006", "PAY-010"],
+            "Beneficiary": [
+                "Tech Solutions SAS",
+                "Global Trade SpA",
+                "European Partners AG",
+                "Tech Solutions SAS",
+            ],
+            "Amount": [
+                "GBP 25,000.00",
+                "GBP 5,750.00",
+                "GBP 8,450.00",
+                "GBP 31,200.00",
+            ],
+            "Target": [
+                "USD 32,125.00",
+                "EUR 6,686.25",
+                "EUR 9,823.75",
+                "USD 40,092.00",
+            ],
+            "Approved By": [
+                "Approver User",
+                "Approver User",
+                "Admin User",
+                "Approver User",
+            ],
+            "Approved Date": (now - age).strftime("%Y-%m-%d %H:%M"),
+            "Status": ["Completed", "Completed", "Approved", "Completed"],
+        }
+    )
+    return table.astype(
+        dict.fromkeys(("Beneficiary", "Approved By", "Status"), "category")
+    )
+
+
+@st.cache_data(ttl="5m")
+def _load_rejected(now: datetime) -> pd.DataFrame:
+    """Build the mock rejected payments, timed relative to now."""
+    age = pd.to_timedelta([6, 3], unit="D")
+
+    return pd.DataFrame(
+        {
+            "Payment ID": ["PAY-007", "PAY-013"],
+            "Beneficiary": ["Digital Consulting", "Unknown Supplier Ltd"],
+            "Amount": ["GBP 15,600.00", "GBP 45,000.00"],
+            "Rejected By": ["Approver User", "Admin User"],
+            "Rejected Date": (now - age).strftime("%Y-%m-%d %H:%M"),
+            "Reason": [
+                "Beneficiary bank details need verification",
+                "Unverified beneficiary - further due diligence required",
+            ],
+        }
+    )
+
 
 st.set_page_config(page_title="Approvals", page_icon="", layout="wide")
 
@@ -17,8 +98,8 @@ st.title(" Payment Approvals")
 st.markdown("Review and approve payment requests")
 st.markdown("---")
 
-# Only Approvers and Admins can approve payments
-can_approve = st.session_state.user_role in ["admin", "approver"]
+# Only Approvers and Admins can approve payments (resolved at login)
+can_approve = st.session_state.get("can_approve", False)
 
 if not can_approve:
     st.warning(" Only Approvers and Admins can access this page")
@@ -27,46 +108,32 @@ if not can_approve:
     )
     st.stop()
 
-# Tabs
-tab1, tab2, tab3 = st.tabs(["⏳ Pending Approvals", " Approved", " Rejected"])
+# Mock timestamps are relative to the current minute, so reruns within a
+# minute share the cached tables
+now = datetime.now().replace(second=0, microsecond=0)
 
-with tab1:
+
+@st.fragment
+def _render_pending_tab(now: datetime):
+    """Render the pending approvals tab with the review form."""
     st.subheader("Payments Awaiting Approval")
 
     # Filters
     col1, col2, col3 = st.columns([2, 2, 1])
 
     with col1:
-        filter_creator = st.selectbox(
-            "Created By", ["All", "Maker User", "Finance Manager"]
-        )
+        st.selectbox("Created By", ["All", "Maker User", "Finance Manager"])
 
     with col2:
-        filter_amount = st.selectbox(
-            "Amount Range", ["All", "< £10k", "£10k - £50k", "> £50k"]
-        )
+        st.selectbox("Amount Range", ["All", "< £10k", "£10k - £50k", "> £50k"])
 
     with col3:
-        filter_urgent = st.checkbox("Urgent Only")
+        st.checkbox("Urgent Only")
 
     st.markdown("---")
 
     # Pending payments
-    pending_data = pd.DataFrame(
-        {
-            "Payment ID": ["PAY-001", "PAY-009", "PAY-012"],
-            "Beneficiary": ["Supplier GmbH", "Supplier GmbH", "Tech Solutions SAS"],
-            "Source Amount": ["GBP 10,500.00", "GBP 9,800.00", "GBP 15,200.00"],
-            "Target Amount": ["EUR 12,208.50", "EUR 11,397.00", "EUR 17,683.00"],
-            "Created By": ["Maker User", "Maker User", "Finance Manager"],
-            "Submitted": [
-                (datetime.now() - timedelta(hours=2)).strftime("%Y-%m-%d %H:%M"),
-                (datetime.now() - timedelta(hours=5)).strftime("%Y-%m-%d %H:%M"),
-                (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d %H:%M"),
-            ],
-            "Priority": [" Urgent", "🟡 Normal", "🟡 Normal"],
-        }
-    )
+    pending_data = _load_pending(now)
 
     st.dataframe(pending_data, use_container_width=True, hide_index=True)
 
@@ -75,7 +142,7 @@ with tab1:
     # Detailed review section
     st.subheader("Review Payment")
 
-    selected_payment = st.selectbox(
+    st.selectbox(
         "Select Payment to Review",
         [
             "PAY-001 - Supplier GmbH (GBP 10,500.00)",
@@ -146,7 +213,10 @@ with tab1:
     st.markdown("**Maker's Comments**")
     st.text_area(
         "Comments from Maker",
-        value="Urgent payment - please review ASAP. Supplier requires payment by end of business today.",
+        value=(
+            "Urgent payment - please review ASAP. "
+            "Supplier requires payment by end of business today."
+        ),
         disabled=True,
         height=80,
     )
@@ -208,45 +278,13 @@ with tab1:
         " **Maker-Checker Control**: You cannot approve payments created by yourself"
     )
 
-with tab2:
+
+@st.fragment
+def _render_approved_tab(now: datetime):
+    """Render the approved payments tab."""
     st.subheader("Approved Payments")
 
-    approved_data = pd.DataFrame(
-        {
-            "Payment ID": ["PAY-002", "PAY-003", "PAY-006", "PAY-010"],
-            "Beneficiary": [
-                "Tech Solutions SAS",
-                "Global Trade SpA",
-                "European Partners AG",
-                "Tech Solutions SAS",
-            ],
-            "Amount": [
-                "GBP 25,000.00",
-                "GBP 5,750.00",
-                "GBP 8,450.00",
-                "GBP 31,200.00",
-            ],
-            "Target": [
-                "USD 32,125.00",
-                "EUR 6,686.25",
-                "EUR 9,823.75",
-                "USD 40,092.00",
-            ],
-            "Approved By": [
-                "Approver User",
-                "Approver User",
-                "Admin User",
-                "Approver User",
-            ],
-            "Approved Date": [
-                (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d %H:%M"),
-                (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d %H:%M"),
-                (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d %H:%M"),
-                (datetime.now() - timedelta(days=9)).strftime("%Y-%m-%d %H:%M"),
-            ],
-            "Status": ["Completed", "Completed", "Approved", "Completed"],
-        }
-    )
+    approved_data = _load_approved(now)
 
     st.dataframe(approved_data, use_container_width=True, hide_index=True)
 
@@ -263,25 +301,13 @@ with tab2:
     with col3:
         st.metric("Avg Approval Time", "2.5 hours")
 
-with tab3:
+
+@st.fragment
+def _render_rejected_tab(now: datetime):
+    """Render the rejected payments tab."""
     st.subheader("Rejected Payments")
 
-    rejected_data = pd.DataFrame(
-        {
-            "Payment ID": ["PAY-007", "PAY-013"],
-            "Beneficiary": ["Digital Consulting", "Unknown Supplier Ltd"],
-            "Amount": ["GBP 15,600.00", "GBP 45,000.00"],
-            "Rejected By": ["Approver User", "Admin User"],
-            "Rejected Date": [
-                (datetime.now() - timedelta(days=6)).strftime("%Y-%m-%d %H:%M"),
-                (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d %H:%M"),
-            ],
-            "Reason": [
-                "Beneficiary bank details need verification",
-                "Unverified beneficiary - further due diligence required",
-            ],
-        }
-    )
+    rejected_data = _load_rejected(now)
 
     st.dataframe(rejected_data, use_container_width=True, hide_index=True)
 
@@ -289,6 +315,19 @@ with tab3:
 
     st.info("ℹ Rejected payments can be edited and resubmitted by the maker")
 
+
+# Tabs
+tab1, tab2, tab3 = st.tabs(["⏳ Pending Approvals", " Approved", " Rejected"])
+
+with tab1:
+    _render_pending_tab(now)
+
+with tab2:
+    _render_approved_tab(now)
+
+with tab3:
+    _render_rejected_tab(now)
+
 # Summary metrics
 st.markdown("---")
 st.subheader(" Approval Statistics")
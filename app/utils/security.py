@@ -3,11 +3,19 @@ Security utilities for password hashing and verification.
 """
 
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+# Argon2id; the C backend releases the GIL while hashing
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+
+# Hashes written before the move to Argon2
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using Argon2id.
 
     Args:
         password: Plain text password
@@ -15,15 +23,15 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    salt = bcrypt.gensalt(rounds=12)
-    hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
-    return hashed.decode("utf-8")
+    return _password_hasher.hash(password)
 
 
 def verify_password(password: str, hashed: str) -> bool:
     """
     Verify a password against a hash.
 
+    Legacy bcrypt hashes are still accepted; see needs_rehash().
+
     Args:
         password: Plain text password
         hashed: Hashed password to check against
@@ -31,4 +39,28 @@ def verify_password(password: str, hashed: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+    if hashed.startswith(_BCRYPT_PREFIXES):
+        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+
+    try:
+        return _password_hasher.verify(hashed, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def needs_rehash(hashed: str) -> bool:
+    """
+    Check whether a stored hash should be replaced after a successful login.
+
+    True for legacy bcrypt hashes and for Argon2 hashes made with older
+    parameters.
+
+    Args:
+        hashed: Stored password hash
+
+    Returns:
+        True if the password should be hashed again
+    """
+    if hashed.startswith(_BCRYPT_PREFIXES):
+        return True
+    return _password_hasher.check_needs_rehash(hashed)
@@ -8,6 +8,22 @@ from app.database.connection import SessionLocal
 from app.services.auth_service import AuthService
 from app.services.audit_service import AuditService
 
+# Signed-out session state, used to initialize and to reset on logout
+SESSION_DEFAULTS = {
+    "authenticated": False,
+    "user_id": None,
+    "user_role": None,
+    "company_id": None,
+    "user_name": None,
+    "user_email": None,
+    "can_create": False,
+    "can_approve": False,
+}
+
+# Roles allowed to create payments and to approve them
+CREATOR_ROLES = frozenset({"admin", "maker"})
+APPROVER_ROLES = frozenset({"admin", "approver"})
+
 # Page configuration
 st.set_page_config(
     page_title=config.APP_NAME,
@@ -16,19 +32,9 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Initialize session state
+# Initialize session state (only on the first run of a session)
 if "authenticated" not in st.session_state:
-    st.session_state.authenticated = False
-if "user_id" not in st.session_state:
-    st.session_state.user_id = None
-if "user_role" not in st.session_state:
-    st.session_state.user_role = None
-if "company_id" not in st.session_state:
-    st.session_state.company_id = None
-if "user_name" not in st.session_state:
-    st.session_state.user_name = None
-if "user_email" not in st.session_state:
-    st.session_state.user_email = None
+    st.session_state.update(SESSION_DEFAULTS)
 
 # Main page
 st.title(" Flow Payment Platform")
@@ -124,6 +130,8 @@ if not st.session_state.authenticated:
                             st.session_state.company_id = user.company_id
                             st.session_state.user_name = user.full_name
                             st.session_state.user_email = user.email
+                            st.session_state.can_create = user.role in CREATOR_ROLES
+                            st.session_state.can_approve = user.role in APPROVER_ROLES
 
                             # Log the login
                             audit_service = AuditService(db)
@@ -142,7 +150,8 @@ if not st.session_state.authenticated:
 else:
     # Dashboard for authenticated users
     st.success(
-        f"Welcome back, {st.session_state.user_name}! (Role: {st.session_state.user_role.title()})"
+        f"Welcome back, {st.session_state.user_name}! "
+        f"(Role: {st.session_state.user_role.title()})"
     )
 
     st.markdown("---")
@@ -234,7 +243,8 @@ else:
     if st.session_state.user_role == "approver":
         st.subheader(" Pending Your Approval")
         st.info(
-            "You have 3 payments waiting for approval. Visit the Approvals page to review."
+            "You have 3 payments waiting for approval. "
+            "Visit the Approvals page to review."
         )
     elif st.session_state.user_role == "maker":
         st.subheader(" Your Draft Payments")
@@ -252,12 +262,7 @@ else:
                 db.close()
 
         # Clear session state
-        st.session_state.authenticated = False
-        st.session_state.user_id = None
-        st.session_state.user_role = None
-        st.session_state.company_id = None
-        st.session_state.user_name = None
-        st.session_state.user_email = None
+        st.session_state.update(SESSION_DEFAULTS)
         st.rerun()
 
 # Sidebar info
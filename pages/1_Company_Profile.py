@@ -3,10 +3,161 @@ Company Profile Management Page
 """
 
 import streamlit as st
-from datetime import datetime
 from app.database.connection import SessionLocal
 from app.services.company_service import CompanyService
-from app.repositories.user_repository import UserRepository
+from app.ui.cached_queries import load_company, load_user_table, clear_company_cache
+
+# Select options, keyed by the stored value
+_COUNTRY_LABELS = {
+    "GB": "GB - United Kingdom",
+    "DE": "DE - Germany",
+    "FR": "FR - France",
+    "ES": "ES - Spain",
+    "IT": "IT - Italy",
+}
+_COUNTRY_CODES = {v: k for k, v in _COUNTRY_LABELS.items()}
+_COUNTRY_OPTIONS = tuple(_COUNTRY_LABELS.values())
+
+_INDUSTRY_OPTIONS = (
+    "Import/Export",
+    "Manufacturing",
+    "Technology",
+    "Consulting",
+    "Retail",
+    "Wholesale",
+    "Other",
+)
+
+_FX_VOLUME_LABELS = {
+    "small": "Small (< £100k/month)",
+    "medium": "Medium (£100k - £500k/month)",
+    "large": "Large (> £500k/month)",
+}
+_FX_VOLUME_BANDS = {v: k for k, v in _FX_VOLUME_LABELS.items()}
+_FX_VOLUME_OPTIONS = tuple(_FX_VOLUME_LABELS.values())
+
+# Role permission summaries for the User Management tab, as ready markdown
+_ROLE_PERMISSIONS = (
+    (
+        "** Admin**",
+        "- Manage company profile\n"
+        "- Add/edit users\n"
+        "- View all reports\n"
+        "- Full system access",
+    ),
+    (
+        "** Maker**",
+        "- Create payments\n"
+        "- Manage beneficiaries\n"
+        "- Request FX quotes\n"
+        "- Cannot approve payments",
+    ),
+    (
+        "** Approver**",
+        "- Approve/reject payments\n"
+        "- View payment details\n"
+        "- Add comments\n"
+        "- Cannot create payments",
+    ),
+)
+
+
+def _show_timestamps(company, col1, col2):
+    """Show when the company was created and last updated."""
+    with col1:
+        st.caption(f"Created: {company['created_at'].strftime('%Y-%m-%d %H:%M')}")
+    with col2:
+        updated_at = company["updated_at"].strftime("%Y-%m-%d %H:%M")
+        st.caption(f"Last Updated: {updated_at}")
+
+
+@st.fragment
+def _company_form(company):
+    """
+    Render the editable company details for admins.
+
+    Runs as a fragment, so changing a field only reruns the form, not the
+    tabs and user table around it. The page's session is closed by the
+    time the fragment reruns, so saving opens its own.
+    """
+    col1, col2 = st.columns(2)
+
+    with col1:
+        company_name = st.text_input(
+            "Company Name *",
+            value=company["company_name"],
+            key="company_name",
+        )
+
+        current_country = _COUNTRY_LABELS.get(
+            company["registered_country"], "GB - United Kingdom"
+        )
+        registered_country = st.selectbox(
+            "Registered Country *",
+            options=_COUNTRY_OPTIONS,
+            index=_COUNTRY_OPTIONS.index(current_country),
+            key="registered_country",
+        )
+
+        current_industry = company["industry_sector"] or "Import/Export"
+        industry_sector = st.selectbox(
+            "Industry Sector",
+            options=_INDUSTRY_OPTIONS,
+            index=(
+                _INDUSTRY_OPTIONS.index(current_industry)
+                if current_industry in _INDUSTRY_OPTIONS
+                else 0
+            ),
+            key="industry_sector",
+        )
+
+    with col2:
+        current_fx_volume = _FX_VOLUME_LABELS.get(
+            company["fx_volume_band"], "Medium (£100k - £500k/month)"
+        )
+        fx_volume_band = st.selectbox(
+            "Expected FX Volume Band",
+            options=_FX_VOLUME_OPTIONS,
+            index=_FX_VOLUME_OPTIONS.index(current_fx_volume),
+            key="fx_volume_band",
+        )
+
+    st.divider()
+
+    _show_timestamps(company, *st.columns(2))
+
+    st.divider()
+
+    col1, col2, col3 = st.columns([1, 1, 4])
+
+    with col1:
+        if st.button(" Save Changes", use_container_width=True, key="save_company"):
+            db = SessionLocal()
+            try:
+                # Update company data
+                updated_data = {
+                    "company_name": company_name,
+                    "registered_country": _COUNTRY_CODES[registered_country],
+                    "industry_sector": industry_sector,
+                    "fx_volume_band": _FX_VOLUME_BANDS[fx_volume_band],
+                }
+
+                CompanyService(db).update_company(
+                    company["id"], updated_data, st.session_state.user_id
+                )
+                clear_company_cache()
+
+                st.success(" Company profile updated successfully!")
+                st.rerun()
+            except Exception as e:
+                st.error(f"Error updating company: {str(e)}")
+            finally:
+                db.close()
+
+    with col2:
+        if st.button(" Refresh", use_container_width=True, key="refresh_company"):
+            st.rerun()
+
 
 st.set_page_config(page_title="Company Profile", page_icon="", layout="wide")
 
@@ -15,228 +166,84 @@ if not st.session_state.get("authenticated", False):
     st.error(" Please log in to access this page")
     st.stop()
 
+# Only Admins can edit the profile and manage users
+is_admin = st.session_state.user_role == "admin"
+
 st.title(" Company Profile")
-st.markdown("---")
+st.divider()
 
-# Get database session
-db = SessionLocal()
+# Get company data (cached across reruns, cleared after writes)
+company = load_company(st.session_state.company_id)
 
-try:
-    # Get company data
-    company_service = CompanyService(db)
-    company = company_service.get_company(st.session_state.company_id)
+if not company:
+    st.error("Company profile not found")
+    st.stop()
 
-    if not company:
-        st.error("Company profile not found")
-        st.stop()
+# Tabs for different sections
+tab1, tab2 = st.tabs([" Company Details", " User Management"])
 
-    # Tabs for different sections
-    tab1, tab2 = st.tabs([" Company Details", " User Management"])
+with tab1:
+    st.subheader("Company Information")
 
-    with tab1:
-        st.subheader("Company Information")
+    if is_admin:
+        _company_form(company)
+    else:
+        # Read-only view as plain text, without building the edit widgets
+        country = company["registered_country"]
+        fx_volume = _FX_VOLUME_LABELS.get(company["fx_volume_band"], "N/A")
 
         col1, col2 = st.columns(2)
+        with col1:
+            st.text(f"Company Name: {company['company_name']}")
+            st.text(f"Registered Country: {_COUNTRY_LABELS.get(country, country)}")
+            st.text(f"Industry Sector: {company['industry_sector'] or 'N/A'}")
+        with col2:
+            st.text(f"Expected FX Volume Band: {fx_volume}")
 
-        # Country mapping
-        country_map = {
-            "GB": "GB - United Kingdom",
-            "DE": "DE - Germany",
-            "FR": "FR - France",
-            "ES": "ES - Spain",
-            "IT": "IT - Italy",
-        }
-
-        country_reverse_map = {v: k for k, v in country_map.items()}
-
-        # Industry sector mapping
-        industry_options = [
-            "Import/Export",
-            "Manufacturing",
-            "Technology",
-            "Consulting",
-            "Retail",
-            "Wholesale",
-            "Other",
-        ]
-
-        # FX volume band mapping
-        fx_volume_map = {
-            "small": "Small (< £100k/month)",
-            "medium": "Medium (£100k - £500k/month)",
-            "large": "Large (> £500k/month)",
-        }
-
-        fx_volume_reverse_map = {v: k for k, v in fx_volume_map.items()}
+        # The timestamps share the columns above
+        _show_timestamps(company, col1, col2)
 
-        with col1:
-            company_name = st.text_input(
-                "Company Name *",
-                value=company.company_name,
-                disabled=(st.session_state.user_role != "admin"),
-                key="company_name",
-            )
-
-            current_country = country_map.get(
-                company.registered_country, "GB - United Kingdom"
-            )
-            registered_country = st.selectbox(
-                "Registered Country *",
-                options=list(country_map.values()),
-                index=list(country_map.values()).index(current_country),
-                disabled=(st.session_state.user_role != "admin"),
-                key="registered_country",
-            )
-
-            current_industry = company.industry_sector or "Import/Export"
-            industry_sector = st.selectbox(
-                "Industry Sector",
-                options=industry_options,
-                index=industry_options.index(current_industry)
-                if current_industry in industry_options
-                else 0,
-                disabled=(st.session_state.user_role != "admin"),
-                key="industry_sector",
-            )
+        st.divider()
+        st.info("ℹ Only Admin users can edit company profile")
+
+with tab2:
+    st.subheader("User Management")
+
+    if is_admin:
+        users = load_user_table(st.session_state.company_id)
+
+        col1, col2 = st.columns([3, 1])
 
         with col2:
-            current_fx_volume = fx_volume_map.get(
-                company.fx_volume_band, "Medium (£100k - £500k/month)"
-            )
-            fx_volume_band = st.selectbox(
-                "Expected FX Volume Band",
-                options=list(fx_volume_map.values()),
-                index=list(fx_volume_map.values()).index(current_fx_volume),
-                disabled=(st.session_state.user_role != "admin"),
-                key="fx_volume_band",
-            )
-
-        st.markdown("---")
-
-        # Display metadata
-        col1, col2 = st.columns(2)
-        with col1:
-            st.caption(f"Created: {company.created_at.strftime('%Y-%m-%d %H:%M')}")
-        with col2:
-            st.caption(f"Last Updated: {company.updated_at.strftime('%Y-%m-%d %H:%M')}")
-
-        st.markdown("---")
-
-        if st.session_state.user_role == "admin":
-            col1, col2, col3 = st.columns([1, 1, 4])
-
-            with col1:
-                if st.button(
-                    " Save Changes", use_container_width=True, key="save_company"
-                ):
-                    try:
-                        # Update company data
-                        updated_data = {
-                            "company_name": company_name,
-                            "registered_country": country_reverse_map[
-                                registered_country
-                            ],
-                            "industry_sector": industry_sector,
-                            "fx_volume_band": fx_volume_reverse_map[fx_volume_band],
-                        }
-
-                        company_service.update_company(
-                            company.id, updated_data, st.session_state.user_id
-                        )
-
-                        st.success(" Company profile updated successfully!")
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Error updating company: {str(e)}")
-
-            with col2:
-                if st.button(
-                    " Refresh", use_container_width=True, key="refresh_company"
-                ):
-                    st.rerun()
-        else:
-            st.info("ℹ Only Admin users can edit company profile")
-
-    with tab2:
-        st.subheader("User Management")
-
-        if st.session_state.user_role == "admin":
-            # Get user repository
-            user_repo = UserRepository(db)
-            users = user_repo.get_by_company(st.session_state.company_id)
-
-            col1, col2 = st.columns([3, 1])
-
-            with col2:
-                if st.button(" Add New User", use_container_width=True, key="add_user"):
-                    st.info("Add user functionality coming in future phase")
-
-            st.markdown("---")
-
-            # Display users
-            if users:
-                import pandas as pd
-
-                users_data = pd.DataFrame(
-                    [
-                        {
-                            "Full Name": user.full_name,
-                            "Email": user.email,
-                            "Role": user.role.title(),
-                            "Status": "Active" if user.is_active else "Inactive",
-                            "Created": user.created_at.strftime("%Y-%m-%d"),
-                        }
-                        for user in users
-                    ]
-                )
+            if st.button(" Add New User", use_container_width=True, key="add_user"):
+                st.info("Add user functionality coming in future phase")
 
-                st.dataframe(users_data, use_container_width=True, hide_index=True)
-            else:
-                st.info("No users found")
-
-            st.markdown("---")
-
-            st.subheader("Role Permissions")
-
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                st.info("** Admin**")
-                st.markdown("""
-                - Manage company profile
-                - Add/edit users
-                - View all reports
-                - Full system access
-                """)
-
-            with col2:
-                st.info("** Maker**")
-                st.markdown("""
-                - Create payments
-                - Manage beneficiaries
-                - Request FX quotes
-                - Cannot approve payments
-                """)
-
-            with col3:
-                st.info("** Approver**")
-                st.markdown("""
-                - Approve/reject payments
-                - View payment details
-                - Add comments
-                - Cannot create payments
-                """)
+        st.divider()
 
+        # Display users
+        if not users.empty:
+            st.dataframe(users, use_container_width=True, hide_index=True)
         else:
-            st.warning(" Only Admin users can manage users")
-            st.info("Contact your administrator to add or modify user accounts")
+            st.info("No users found")
+
+        st.divider()
+
+        st.subheader("Role Permissions")
+
+        for col, (title, permissions) in zip(
+            st.columns(len(_ROLE_PERMISSIONS)), _ROLE_PERMISSIONS
+        ):
+            with col:
+                st.info(title)
+                st.markdown(permissions)
 
-finally:
-    db.close()
+    else:
+        st.warning(" Only Admin users can manage users")
+        st.info("Contact your administrator to add or modify user accounts")
 
 # Sidebar info
 with st.sidebar:
     st.info(f"**Logged in as:** {st.session_state.user_name}")
     st.caption(f"Role: {st.session_state.user_role.title()}")
     if company:
-        st.caption(f"Company: {company.company_name}")
+        st.caption(f"Company: {company['company_name']}")
@@ -96,10 +96,13 @@ try:
 
     active_quotes = fx_service.get_active_quotes(st.session_state.company_id)
 
+    # One clock read for every quote on this run
+    now = datetime.utcnow()
+
     if active_quotes:
         for quote in active_quotes:
             # Check if still valid
-            time_remaining = fx_service.get_quote_time_remaining(quote)
+            time_remaining = fx_service.get_quote_time_remaining(quote, now)
             is_valid = time_remaining > 0
 
             # Create expander for each quote
@@ -153,7 +156,7 @@ try:
 
     # Add auto-refresh for active quotes
     if active_quotes and any(
-        fx_service.get_quote_time_remaining(q) > 0 for q in active_quotes
+        fx_service.get_quote_time_remaining(q, now) > 0 for q in active_quotes
     ):
         time.sleep(5)  # Refresh every 5 seconds
         st.rerun()
@@ -163,14 +166,12 @@ try:
     # Recent quotes history
     st.subheader(" Recent Quotes (Last 7 Days)")
 
-    recent_quotes = fx_service.get_company_quotes(
-        st.session_state.company_id, include_expired=True
-    )[:20]
+    recent_quotes = fx_service.get_recent_quote_summaries(st.session_state.company_id)
 
     if recent_quotes:
         quote_list = []
         for quote in recent_quotes:
-            is_valid = fx_service.is_quote_valid(quote)
+            is_valid = fx_service.is_quote_valid(quote, now)
             quote_list.append(
                 {
                     "Quote ID": quote.quote_id[:20] + "...",
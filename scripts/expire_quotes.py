@@ -0,0 +1,27 @@
+"""
+Mark past-expiry FX quotes as expired.
+
+Intended to run on a schedule (e.g. cron every few minutes) so the
+request path never pays for the bulk update.
+"""
+
+from app.database.connection import SessionLocal
+from app.services.fx_service import FXService
+
+
+def expire_quotes():
+    """Expire all quotes past their expiry time."""
+    db = SessionLocal()
+
+    try:
+        expired = FXService(db).expire_old_quotes()
+        print(f"✓ Marked {expired} quote(s) as expired")
+    except Exception as e:
+        print(f"✗ Error expiring quotes: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    expire_quotes()
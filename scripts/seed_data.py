@@ -24,7 +24,6 @@ def seed_database():
         )
         db.add(company)
         db.commit()
-        db.refresh(company)
         print(f"✓ Created company: {company.company_name}")
 
         # Create test users
@@ -52,6 +52,15 @@ echo "4️⃣  Seeding test data..."
 python scripts/seed_data.py
 echo "✓ Test data seeded"
 echo ""
+# Precompile bytecode so the first app start does not pay for it
+echo "5️⃣  Precompiling Python bytecode..."
+python -m compileall -j0 -q app scripts main.py pages
+# Third-party packages can ship files that do not compile; warn, don't fail
+SITE_PACKAGES=$(python -c 'import sysconfig; print(sysconfig.get_paths()["purelib"])')
+python -m compileall -j0 -q "$SITE_PACKAGES" \
+    || echo "⚠️  Some site-packages files failed to compile; they will compile on import"
+echo "✓ Bytecode cache ready"
+echo ""
 
 echo "=============================="
 echo "✅ Database Setup Complete!"
@@ -0,0 +1,32 @@
+"""
+Tests for the audit log repository.
+"""
+
+from sqlalchemy import func, select
+from app.database.models import AuditLog
+from app.repositories.audit_repository import AuditEntry, AuditRepository
+
+
+def test_create_many_stores_unset_values_as_sql_null(db_session):
+    AuditRepository(db_session).create_many(
+        [
+            AuditEntry(None, "payment", 1, "updated", old_values={"status": "draft"}),
+            AuditEntry(None, "payment", 2, "created", new_values={"status": "draft"}),
+            AuditEntry(None, "payment", 3, "viewed"),
+        ]
+    )
+
+    null_old_values = db_session.scalar(
+        select(func.count()).select_from(AuditLog).where(AuditLog.old_values.is_(None))
+    )
+    null_new_values = db_session.scalar(
+        select(func.count()).select_from(AuditLog).where(AuditLog.new_values.is_(None))
+    )
+    assert null_old_values == 2
+    assert null_new_values == 2
+
+
+def test_create_many_with_no_rows_is_a_no_op(db_session):
+    AuditRepository(db_session).create_many([])
+
+    assert db_session.scalar(select(func.count()).select_from(AuditLog)) == 0
@@ -0,0 +1,83 @@
+"""
+Tests for the shared repository CRUD operations.
+"""
+
+from app.repositories.beneficiary_repository import BeneficiaryRepository
+
+
+def _create(repo, **overrides):
+    return repo.create(
+        {
+            "company_id": 1,
+            "beneficiary_name": "Acme GmbH",
+            "country": "DE",
+            **overrides,
+        }
+    )
+
+
+def test_create_flushes_and_populates_id(db_session):
+    repo = BeneficiaryRepository(db_session)
+
+    beneficiary = _create(repo)
+
+    assert beneficiary.id is not None
+    assert repo.get_by_id(beneficiary.id) is beneficiary
+
+
+def test_update_refreshes_loaded_entity(db_session):
+    repo = BeneficiaryRepository(db_session)
+    beneficiary = _create(repo)
+
+    updated = repo.update(beneficiary.id, {"beneficiary_name": "Acme AG"})
+
+    assert updated is beneficiary
+    assert beneficiary.beneficiary_name == "Acme AG"
+
+
+def test_update_ignores_immutable_and_unknown_keys(db_session):
+    repo = BeneficiaryRepository(db_session)
+    beneficiary = _create(repo)
+    original_id = beneficiary.id
+
+    updated = repo.update(original_id, {"id": original_id + 1, "unknown": "x"})
+
+    assert updated is beneficiary
+    assert beneficiary.id == original_id
+
+
+def test_update_missing_entity_returns_none(db_session):
+    repo = BeneficiaryRepository(db_session)
+
+    assert repo.update(999, {"beneficiary_name": "Acme AG"}) is None
+
+
+def test_update_with_changes_reports_old_values(db_session):
+    repo = BeneficiaryRepository(db_session)
+    beneficiary = _create(repo)
+
+    entity, changes = repo.update_with_changes(
+        beneficiary.id,
+        {"beneficiary_name": "Acme AG", "country": "DE", "beneficiary_type": "b2b"},
+    )
+
+    assert entity is beneficiary
+    assert entity.beneficiary_name == "Acme AG"
+    # Unchanged columns are left out; a column that was NULL reports None
+    assert changes == {"beneficiary_name": "Acme GmbH", "beneficiary_type": None}
+
+
+def test_update_with_changes_without_changes(db_session):
+    repo = BeneficiaryRepository(db_session)
+    beneficiary = _create(repo)
+
+    entity, changes = repo.update_with_changes(beneficiary.id, {"country": "DE"})
+
+    assert entity is beneficiary
+    assert changes == {}
+
+
+def test_update_with_changes_missing_entity(db_session):
+    repo = BeneficiaryRepository(db_session)
+
+    assert repo.update_with_changes(999, {"country": "FR"}) == (None, {})
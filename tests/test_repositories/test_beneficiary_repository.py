@@ -0,0 +1,47 @@
+"""
+Tests for the beneficiary repositories.
+"""
+
+from app.database.models import Beneficiary
+from app.repositories.beneficiary_repository import BeneficiaryBankAccountRepository
+
+
+def _add_beneficiary(db):
+    beneficiary = Beneficiary(company_id=1, beneficiary_name="Acme GmbH", country="DE")
+    db.add(beneficiary)
+    db.flush()
+    return beneficiary
+
+
+def _account_data(beneficiary, **overrides):
+    return {
+        "beneficiary_id": beneficiary.id,
+        "account_holder_name": "Acme GmbH",
+        "iban": "DE89370400440532013000",
+        "currency": "EUR",
+        **overrides,
+    }
+
+
+def test_set_default_unsets_loaded_accounts(db_session):
+    beneficiary = _add_beneficiary(db_session)
+    account_repo = BeneficiaryBankAccountRepository(db_session)
+    first = account_repo.create(_account_data(beneficiary, is_default=True))
+    second = account_repo.create(_account_data(beneficiary))
+
+    account_repo.set_default(second.id)
+
+    # Both accounts are already in the session and must reflect the update
+    assert first.is_default is False
+    assert second.is_default is True
+
+
+def test_create_default_unsets_previous_default(db_session):
+    beneficiary = _add_beneficiary(db_session)
+    account_repo = BeneficiaryBankAccountRepository(db_session)
+    first = account_repo.create(_account_data(beneficiary, is_default=True))
+
+    second = account_repo.create(_account_data(beneficiary, is_default=True))
+
+    assert first.is_default is False
+    assert second.is_default is True
@@ -0,0 +1,89 @@
+"""
+Tests for the audit service.
+"""
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from app.database.connection import Base
+from app.database.models import AuditLog
+from app.services.audit_service import AuditService, AuditWriter
+
+
+class RecordingWriter:
+    """Stand-in for AuditWriter that keeps submitted entries."""
+
+    def __init__(self):
+        self.entries = []
+
+    def submit(self, entries):
+        self.entries.extend(entries)
+
+
+def _count(db, **filters):
+    return db.scalar(select(func.count()).select_from(AuditLog).filter_by(**filters))
+
+
+def test_log_action_writes_and_commits(db_session):
+    audit_log = AuditService(db_session).log_action(
+        user_id=None,
+        entity_type="payment",
+        entity_id=42,
+        action="created",
+        new_values={"amount": "100.00"},
+    )
+
+    # Survives a rollback, so it was committed
+    db_session.rollback()
+    assert audit_log.id is not None
+    stored = db_session.get(AuditLog, audit_log.id)
+    assert stored.entity_id == 42
+    assert stored.new_values == {"amount": "100.00"}
+    assert stored.old_values is None
+
+
+def test_log_login_and_logout_write_immediately(db_session):
+    audit_service = AuditService(db_session)
+    audit_service.log_login(7)
+    audit_service.log_logout(7)
+
+    assert _count(db_session, entity_type="user", entity_id=7) == 2
+
+
+def test_queue_action_is_only_written_on_flush(db_session):
+    writer = RecordingWriter()
+    audit_service = AuditService(db_session, writer=writer)
+
+    audit_service.queue_action(None, "payment", 1, "viewed")
+    assert writer.entries == []
+
+    audit_service.flush()
+    assert [entry.entity_id for entry in writer.entries] == [1]
+    assert _count(db_session) == 0
+
+
+def test_context_manager_drops_queue_on_error(db_session):
+    writer = RecordingWriter()
+
+    with pytest.raises(RuntimeError):
+        with AuditService(db_session, writer=writer) as audit_service:
+            audit_service.queue_action(None, "payment", 1, "viewed")
+            raise RuntimeError
+
+    assert writer.entries == []
+
+
+def test_audit_writer_writes_queued_entries_on_stop(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    writer = AuditWriter(batch_size=2, session_factory=session_factory)
+
+    with AuditService(session_factory(), writer=writer) as audit_service:
+        for entity_id in range(5):
+            audit_service.queue_action(None, "payment", entity_id, "viewed")
+    writer.stop()
+
+    with session_factory() as db:
+        assert _count(db, action="viewed") == 5
+    engine.dispose()
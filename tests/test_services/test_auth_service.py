@@ -0,0 +1,75 @@
+"""
+Tests for the authentication service.
+"""
+
+import bcrypt
+from app.database.models import User
+from app.services.auth_service import AuthService
+from app.utils.security import hash_password, needs_rehash, verify_password
+
+
+def _add_user(db, password_hash, is_active=True):
+    user = User(
+        email="maker@example.com",
+        password_hash=password_hash,
+        full_name="Maker",
+        role="maker",
+        company_id=1,
+        is_active=is_active,
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _bcrypt_hash(password):
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+
+def test_hash_password_uses_argon2():
+    hashed = hash_password("s3cret")
+
+    assert hashed.startswith("$argon2id$")
+    assert verify_password("s3cret", hashed)
+    assert not verify_password("wrong", hashed)
+    assert not needs_rehash(hashed)
+
+
+def test_verify_password_accepts_legacy_bcrypt():
+    hashed = _bcrypt_hash("s3cret")
+
+    assert verify_password("s3cret", hashed)
+    assert not verify_password("wrong", hashed)
+    assert needs_rehash(hashed)
+
+
+def test_authenticate_rehashes_legacy_bcrypt(db_session):
+    _add_user(db_session, _bcrypt_hash("s3cret"))
+
+    user = AuthService(db_session).authenticate("maker@example.com", "s3cret")
+
+    assert user is not None
+    assert user.password_hash.startswith("$argon2id$")
+    # The new hash was committed and still verifies
+    db_session.rollback()
+    db_session.refresh(user)
+    assert user.password_hash.startswith("$argon2id$")
+    assert verify_password("s3cret", user.password_hash)
+
+
+def test_authenticate_wrong_password_keeps_legacy_hash(db_session):
+    legacy_hash = _bcrypt_hash("s3cret")
+    user = _add_user(db_session, legacy_hash)
+
+    assert AuthService(db_session).authenticate("maker@example.com", "nope") is None
+    assert user.password_hash == legacy_hash
+
+
+def test_authenticate_rejects_inactive_user(db_session):
+    _add_user(db_session, hash_password("s3cret"), is_active=False)
+
+    assert AuthService(db_session).authenticate("maker@example.com", "s3cret") is None
+
+
+def test_authenticate_rejects_unknown_user(db_session):
+    assert AuthService(db_session).authenticate("nobody@example.com", "s3cret") is None
@@ -0,0 +1,55 @@
+"""
+Tests for the beneficiary service.
+"""
+
+from sqlalchemy import select
+from app.database.models import AuditLog
+from app.services.beneficiary_service import BeneficiaryService
+
+
+def _create(service):
+    return service.create_beneficiary(
+        {"company_id": 1, "beneficiary_name": "Acme GmbH", "country": "DE"},
+        user_id=1,
+    )
+
+
+def _audit_actions(db, beneficiary_id):
+    return db.scalars(
+        select(AuditLog.action)
+        .where(AuditLog.entity_type == "beneficiary")
+        .where(AuditLog.entity_id == beneficiary_id)
+        .order_by(AuditLog.id)
+    ).all()
+
+
+def test_update_beneficiary_audits_changed_fields(db_session):
+    service = BeneficiaryService(db_session)
+    beneficiary = _create(service)
+
+    service.update_beneficiary(beneficiary.id, {"beneficiary_name": "Acme AG"}, 1)
+
+    updated = db_session.scalars(
+        select(AuditLog).where(AuditLog.action == "updated")
+    ).one()
+    assert updated.old_values == {"beneficiary_name": "Acme GmbH"}
+    assert updated.new_values == {"beneficiary_name": "Acme AG"}
+
+
+def test_update_beneficiary_skips_audit_for_unaudited_fields(db_session):
+    service = BeneficiaryService(db_session)
+    beneficiary = _create(service)
+
+    service.update_beneficiary(beneficiary.id, {"is_active": False}, 1)
+
+    assert beneficiary.is_active is False
+    assert _audit_actions(db_session, beneficiary.id) == ["created"]
+
+
+def test_update_beneficiary_skips_audit_without_changes(db_session):
+    service = BeneficiaryService(db_session)
+    beneficiary = _create(service)
+
+    service.update_beneficiary(beneficiary.id, {"country": "DE"}, 1)
+
+    assert _audit_actions(db_session, beneficiary.id) == ["created"]
@@ -0,0 +1,57 @@
+"""
+Tests for the company service.
+"""
+
+from datetime import datetime, timezone
+from sqlalchemy import select
+from app.database.models import AuditLog, Company
+from app.services.company_service import CompanyService
+
+
+def _add_company(db):
+    company = Company(company_name="Acme Ltd", registered_country="GB")
+    db.add(company)
+    db.commit()
+    return company
+
+
+def _audit_actions(db, company_id):
+    return db.scalars(
+        select(AuditLog.action)
+        .where(AuditLog.entity_type == "company")
+        .where(AuditLog.entity_id == company_id)
+    ).all()
+
+
+def test_update_company_audits_changed_fields(db_session):
+    company = _add_company(db_session)
+
+    CompanyService(db_session).update_company(
+        company.id, {"company_name": "Acme Group Ltd"}, 1
+    )
+
+    updated = db_session.scalars(
+        select(AuditLog).where(AuditLog.action == "updated")
+    ).one()
+    assert updated.old_values == {"company_name": "Acme Ltd"}
+    assert updated.new_values == {"company_name": "Acme Group Ltd"}
+
+
+def test_update_company_skips_audit_for_unaudited_fields(db_session):
+    company = _add_company(db_session)
+
+    CompanyService(db_session).update_company(
+        company.id, {"updated_at": datetime(2026, 1, 1, tzinfo=timezone.utc)}, 1
+    )
+
+    assert _audit_actions(db_session, company.id) == []
+
+
+def test_update_company_skips_audit_without_changes(db_session):
+    company = _add_company(db_session)
+
+    CompanyService(db_session).update_company(
+        company.id, {"registered_country": "GB"}, 1
+    )
+
+    assert _audit_actions(db_session, company.id) == []
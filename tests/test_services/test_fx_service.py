@@ -0,0 +1,68 @@
+"""
+Tests for the FX service.
+"""
+
+from decimal import Decimal
+import pytest
+from app.services import fx_service
+from app.services.fx_service import FXService
+
+
+class StubRateProvider:
+    """Provider returning bare Decimal rates, like FixerIOProvider."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.calls = 0
+
+    def get_rate(self, from_currency, to_currency):
+        self.calls += 1
+        return self.rate
+
+
+@pytest.fixture(autouse=True)
+def clear_live_rate_cache():
+    fx_service._LIVE_RATE_CACHE.clear()
+    yield
+    fx_service._LIVE_RATE_CACHE.clear()
+
+
+def _service(db, provider):
+    service = FXService(db)
+    service.fx_provider = provider
+    service.provider_name = "Stub"
+    return service
+
+
+def test_get_live_rate_normalises_decimal_rates(db_session):
+    service = _service(db_session, StubRateProvider(Decimal("1.2500")))
+
+    rate_info = service.get_live_rate("gbp", "usd", Decimal("100"))
+
+    assert rate_info["from_currency"] == "GBP"
+    assert rate_info["to_currency"] == "USD"
+    assert rate_info["rate"] == Decimal("1.2500")
+    assert rate_info["inverse_rate"] == Decimal("0.8000")
+    assert rate_info["target_amount"] == Decimal("125.00")
+
+
+def test_get_live_rate_reuses_cached_rate(db_session):
+    provider = StubRateProvider(Decimal("1.2500"))
+    service = _service(db_session, provider)
+
+    service.get_live_rate("GBP", "USD")
+    service.get_live_rate("GBP", "USD", Decimal("10"))
+
+    assert provider.calls == 1
+
+
+def test_get_live_rate_does_not_cache_failures(db_session):
+    provider = StubRateProvider(None)
+    service = _service(db_session, provider)
+
+    with pytest.raises(ValueError):
+        service.get_live_rate("GBP", "USD")
+
+    provider.rate = Decimal("1.2500")
+    assert service.get_live_rate("GBP", "USD")["rate"] == Decimal("1.2500")
+    assert provider.calls == 2
@@ -0,0 +1,83 @@
+"""
+Tests for the financial data validators.
+"""
+
+import pytest
+from app.utils.validators import format_iban, validate_iban, validate_swift_bic
+
+
+@pytest.mark.parametrize(
+    "iban",
+    [
+        "GB82WEST12345698765432",
+        "GB82 WEST 1234 5698 7654 32",
+        "gb82west12345698765432",
+        "DE89370400440532013000",
+        # Letters inside the BBAN count as two digits in the checksum
+        "FR1420041010050500013M02606",
+    ],
+)
+def test_validate_iban_accepts_valid(iban):
+    assert validate_iban(iban) == (True, None)
+
+
+def test_validate_iban_rejects_wrong_checksum():
+    assert validate_iban("GB82WEST12345698765433") == (
+        False,
+        "IBAN checksum validation failed",
+    )
+
+
+def test_validate_iban_rejects_letter_bearing_iban_with_wrong_checksum():
+    assert validate_iban("FR1420041010050500013N02606") == (
+        False,
+        "IBAN checksum validation failed",
+    )
+
+
+def test_validate_iban_rejects_trailing_newline():
+    is_valid, error = validate_iban("DE89370400440532013000\n")
+
+    assert not is_valid
+    assert error.startswith("IBAN format invalid")
+
+
+@pytest.mark.parametrize(
+    "iban, error",
+    [
+        ("", "IBAN is required"),
+        ("GB82WEST1234", "IBAN must be between 15 and 34 characters"),
+        (
+            "1282WEST12345698765432",
+            "IBAN format invalid (should start with 2 letters and 2 digits)",
+        ),
+    ],
+)
+def test_validate_iban_rejects_malformed(iban, error):
+    assert validate_iban(iban) == (False, error)
+
+
+@pytest.mark.parametrize("swift", ["DEUTDEFF", "DEUTDEFF500", "deutdeff", "DEUTDE1F"])
+def test_validate_swift_bic_accepts_valid(swift):
+    assert validate_swift_bic(swift) == (True, None)
+
+
+@pytest.mark.parametrize("swift", ["DEU1DEFF", "DEUT1EFF", "DEUTD3FF500"])
+def test_validate_swift_bic_rejects_digit_in_bank_or_country_code(swift):
+    assert validate_swift_bic(swift) == (False, "Invalid SWIFT/BIC format")
+
+
+@pytest.mark.parametrize(
+    "swift, error",
+    [
+        ("", "SWIFT/BIC code is required"),
+        ("DEUTDEF", "SWIFT/BIC code must be 8 or 11 characters"),
+        ("DEUTDEFF\n", "SWIFT/BIC code must be 8 or 11 characters"),
+    ],
+)
+def test_validate_swift_bic_rejects_malformed(swift, error):
+    assert validate_swift_bic(swift) == (False, error)
+
+
+def test_format_iban_groups_by_four():
+    assert format_iban("gb82west12345698765432") == "GB82 WEST 1234 5698 7654 32"